@@ -0,0 +1,97 @@
+import argparse
+import importlib.metadata
+import json
+import platform
+import sys
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+
+from benchmarks.suite import benchmarks, run_benchmark
+from pokedex import load_all
+
+
+def run(args: argparse.Namespace) -> None:
+    if args.cache_path:
+        load_all(args.cache_path)
+
+    results = {}
+    for benchmark in benchmarks(args.seed):
+        if benchmark.cold and not args.cold:
+            continue
+        if args.filter and not any(x in benchmark.name for x in args.filter):
+            continue
+        result = run_benchmark(benchmark)
+        results[benchmark.name] = asdict(result)
+        print(f"{benchmark.name:<32} {result.median * 1e6:>12.2f} us/op")
+
+    output = {
+        "metadata": {
+            "pokedex": importlib.metadata.version("pokedex"),
+            "python": sys.version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "date": datetime.now(UTC).isoformat(),
+        },
+        "results": results,
+    }
+    with args.output.open("w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+        f.write("\n")
+
+
+def compare(args: argparse.Namespace) -> None:
+    with args.base.open(encoding="utf-8") as f:
+        base = json.load(f)["results"]
+    with args.new.open(encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = []
+    for name in sorted(base.keys() & new.keys()):
+        ratio = new[name]["median"] / base[name]["median"]
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - args.threshold:
+            flag = "  improvement"
+        print(
+            f"{name:<32} {base[name]['median'] * 1e6:>12.2f} "
+            f"{new[name]['median'] * 1e6:>12.2f} us/op {ratio:>7.2f}x{flag}"
+        )
+
+    if regressions:
+        sys.exit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--output", type=Path, default=Path("benchmarks.json"))
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--cache-path", type=Path, help="directory of the cache")
+    run_parser.add_argument(
+        "--cold", action="store_true", help="include cold cache builds (slow)"
+    )
+    run_parser.add_argument(
+        "--filter", action="append", help="only run benchmarks matching this"
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("base", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1, help="relative change to report"
+    )
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        compare(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+import gc
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from pokedex import (
+    Ability,
+    BaseEntity,
+    EggGroup,
+    GameGroup,
+    Language,
+    Nature,
+    Pokemon,
+    Stat,
+    Type,
+    cache,
+    calculate_stats,
+    load_all,
+    set_context,
+)
+from pokedex.entities.base import EntityRef
+
+
+@dataclass
+class Benchmark:
+    name: str
+    # Returns the function to time, and how many operations each call performs
+    setup: Callable[[], tuple[Callable[[], object], int]]
+    repeats: int = 5
+    cold: bool = False
+
+
+@dataclass
+class Result:
+    ops: int
+    repeats: int
+    min: float
+    median: float
+    mean: float
+
+
+def _entities() -> list[type[BaseEntity]]:
+    return BaseEntity.__subclasses__()
+
+
+def _sample[T](rng: random.Random, population: list[T], k: int) -> list[T]:
+    return rng.sample(population, min(k, len(population)))
+
+
+def _cold_build() -> tuple[Callable[[], object], int]:
+    def run() -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            load_all(Path(temp_dir))
+        # Point the cache back to the warm copy
+        load_all(cache_path)
+
+    cache_path = cache.get(Pokemon).path.parent
+    return run, 1
+
+
+def _import() -> tuple[Callable[[], object], int]:
+    # Includes the interpreter startup, use `python -X importtime` for details
+    def run() -> None:
+        subprocess.run([sys.executable, "-c", "import pokedex"], check=True)
+
+    return run, 1
+
+
+def _warm_load_all() -> tuple[Callable[[], object], int]:
+    cache_path = cache.get(Pokemon).path.parent
+    return lambda: load_all(cache_path), 1
+
+
+def _get(
+    entity: type[BaseEntity], seed: int
+) -> Callable[[], tuple[Callable[[], object], int]]:
+    def setup() -> tuple[Callable[[], object], int]:
+        identifiers = _sample(random.Random(seed), list(entity.list_identifiers()), 200)
+
+        def run() -> None:
+            for identifier in identifiers:
+                entity.get(identifier)
+
+        return run, len(identifiers)
+
+    return setup
+
+
+def _threaded_get(threads: int, seed: int) -> tuple[Callable[[], object], int]:
+    # Same lookups split between threads, each one reading through its own
+    # handles: time per lookup shows how reads scale with threads
+    from concurrent.futures import ThreadPoolExecutor
+
+    identifiers = _sample(random.Random(seed), list(Pokemon.list_identifiers()), 800)
+    batches = [identifiers[i::threads] for i in range(threads)]
+    executor = ThreadPoolExecutor(threads)
+
+    def read(batch: list[str]) -> None:
+        for identifier in batch:
+            Pokemon.get(identifier)
+
+    def run() -> None:
+        list(executor.map(read, batches))
+
+    return run, len(identifiers)
+
+
+def _search(
+    entity: type[BaseEntity], seed: int
+) -> Callable[[], tuple[Callable[[], object], int]]:
+    def setup() -> tuple[Callable[[], object], int]:
+        names = _sample(random.Random(seed), sorted(cache.get(entity).index), 1000)
+
+        def run() -> None:
+            for name in names:
+                entity.search(name)
+
+        return run, len(names)
+
+    return setup
+
+
+def _list_identifiers(
+    entity: type[BaseEntity],
+) -> Callable[[], tuple[Callable[[], object], int]]:
+    def setup() -> tuple[Callable[[], object], int]:
+        return entity.list_identifiers, 1
+
+    return setup
+
+
+def _entity_ref_get(seed: int) -> tuple[Callable[[], object], int]:
+    identifiers = _sample(random.Random(seed), list(Pokemon.list_identifiers()), 50)
+    refs: list[EntityRef[Ability] | EntityRef[EggGroup] | EntityRef[Type]] = []
+    for identifier in identifiers:
+        for form in Pokemon.get(identifier).forms.values():
+            refs.extend(form.types.get() or [])
+            refs.extend(form.abilities.get() or [])
+            refs.extend(form.egg_groups.get() or [])
+            if ability := form.hidden_ability.get():
+                refs.append(ability)
+
+    def run() -> None:
+        for ref in refs:
+            ref.get()
+
+    return run, len(refs)
+
+
+def _localized_get(seed: int) -> tuple[Callable[[], object], int]:
+    rng = random.Random(seed)
+    identifiers = _sample(rng, list(Pokemon.list_identifiers()), 200)
+    names = [Pokemon.get(x).names for x in identifiers]
+    contexts = [
+        (rng.choice(list(GameGroup)), rng.choice(list(Language))) for _ in names
+    ]
+
+    def run() -> None:
+        for name, (game_group, language) in zip(names, contexts, strict=True):
+            with set_context(game_group, language):
+                name.get()
+
+    return run, len(names)
+
+
+def _calculate_stats(seed: int) -> tuple[Callable[[], object], int]:
+    rng = random.Random(seed)
+    size = 100_000
+    game_group = GameGroup.SCARLET_VIOLET
+    pokemon = [Pokemon.get(x) for x in Pokemon.list_identifiers()]
+    forms = [
+        form
+        for x in pokemon
+        for form in x.forms.values()
+        if game_group in form.base_stats
+    ]
+    natures = [Nature.get(x) for x in Nature.list_identifiers()]
+
+    batch_forms = [rng.choice(forms) for _ in range(size)]
+    levels = [rng.randint(1, 100) for _ in range(size)]
+    ivs = {x: [rng.randint(0, 31) for _ in range(size)] for x in Stat}
+    evs = {x: [rng.randint(0, 252) for _ in range(size)] for x in Stat}
+    batch_natures = [rng.choice(natures) for _ in range(size)]
+
+    def run() -> None:
+        calculate_stats(game_group, batch_forms, levels, ivs, evs, batch_natures)
+
+    return run, size
+
+
+def benchmarks(seed: int) -> Iterator[Benchmark]:
+    yield Benchmark("build.cold", _cold_build, repeats=1, cold=True)
+    yield Benchmark("import", _import)
+    yield Benchmark("load_all.warm", _warm_load_all)
+    for entity in _entities():
+        yield Benchmark(f"get.{entity.yaml_name}", _get(entity, seed))
+    for threads in (1, 2, 4, 8):
+        yield Benchmark(
+            f"get.threads.{threads}",
+            partial(_threaded_get, threads, seed),
+        )
+    for entity in _entities():
+        yield Benchmark(f"search.{entity.yaml_name}", _search(entity, seed))
+    for entity in _entities():
+        yield Benchmark(
+            f"list_identifiers.{entity.yaml_name}", _list_identifiers(entity)
+        )
+    yield Benchmark("entity_ref.get", lambda: _entity_ref_get(seed))
+    yield Benchmark("localized.get", lambda: _localized_get(seed))
+    yield Benchmark("calculate_stats", lambda: _calculate_stats(seed))
+
+
+def run_benchmark(benchmark: Benchmark) -> Result:
+    func, ops = benchmark.setup()
+    if not benchmark.cold:
+        func()  # warmup
+
+    timings = []
+    for _ in range(benchmark.repeats):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) / ops)
+
+    return Result(
+        ops=ops,
+        repeats=benchmark.repeats,
+        min=min(timings),
+        median=statistics.median(timings),
+        mean=statistics.fmean(timings),
+    )
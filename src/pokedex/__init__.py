@@ -1,3 +1,6 @@
+from typing import TYPE_CHECKING
+
+from pokedex.cache import aload_all as aload_all
 from pokedex.cache import load_all as load_all
 from pokedex.context import set_context as set_context
 from pokedex.entities.abilities import Ability as Ability
@@ -15,3 +18,18 @@ from pokedex.enums import GameGroup as GameGroup
 from pokedex.enums import HeldItemSlot as HeldItemSlot
 from pokedex.enums import Language as Language
 from pokedex.enums import Stat as Stat
+from pokedex.resolve import resolve_names as resolve_names
+from pokedex.stats import calculate_stats as calculate_stats
+
+if TYPE_CHECKING:
+    from pokedex.snapshot import Snapshot as Snapshot
+
+
+def __getattr__(name: str) -> object:
+    # Deferred to keep `import pokedex` fast, its record types are costly
+    if name == "Snapshot":
+        from pokedex.snapshot import Snapshot
+
+        return Snapshot
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -0,0 +1,56 @@
+import argparse
+from pathlib import Path
+
+from pokedex import cache
+from pokedex.entities.base import BaseEntity
+from pokedex.export import export
+from pokedex.serve import serve
+
+
+def main() -> None:
+    entities = {entity.yaml_name: entity for entity in BaseEntity.__subclasses__()}
+
+    parser = argparse.ArgumentParser(prog="python -m pokedex")
+    parser.add_argument("--cache-path", type=Path, help="directory of the cache")
+    parser.add_argument(
+        "--cache-backend", choices=["shelve", "sqlite"], help="storage of the cache"
+    )
+    parser.add_argument(
+        "--preload", action="store_true", help="keep the whole cache in memory"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="export entities to files")
+    export_parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    export_parser.add_argument(
+        "--entity",
+        action="append",
+        choices=entities,
+        help="entity to export, can be repeated (default: all)",
+    )
+    export_parser.add_argument(
+        "--output", type=Path, default=Path(), help="output directory"
+    )
+    export_parser.add_argument(
+        "--jobs", type=int, default=1, help="number of entities exported in parallel"
+    )
+
+    serve_parser = subparsers.add_parser("serve", help="serve entities as JSON")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+
+    args = parser.parse_args()
+
+    if args.cache_path or args.cache_backend or args.preload:
+        cache.load_all(args.cache_path, args.cache_backend, preload=args.preload)
+
+    if args.command == "export":
+        selected = [entities[x] for x in args.entity or entities]
+        for path in export(selected, args.format, args.output, args.jobs):
+            print(path)
+    elif args.command == "serve":
+        serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,56 +1,361 @@
 import atexit
-import importlib.metadata
+import contextvars
+import dbm
+import gc
+import itertools
 import os
+import pickle
 import shelve
 import shutil
 import tempfile
-import unicodedata
+import threading
+import warnings
+import weakref
 from collections import defaultdict
-from collections.abc import Collection, Mapping, Sequence
+from collections.abc import (
+    Callable,
+    Collection,
+    Hashable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 from contextlib import suppress
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
-from typing import cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, cast
 
-import yaml
-
-from pokedex.cache.converter import converter
+from pokedex.cache import graph, manifest, metrics
+from pokedex.cache.manifest import Verify
+from pokedex.cache.metrics import stats as stats
+from pokedex.cache.text import TextIndex, build_text_indexes, normalize_value, tokenize
 from pokedex.entities.base import BaseEntity, EntityMap, EntityRef
-from pokedex.enums import Language
+from pokedex.entities.pokemon import Pokemon
+from pokedex.enums import GameGroup, Language
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    from pokedex.cache import sqlite
+
+# Bumped whenever the layout of the shelves changes
+_CACHE_FORMAT = 3
+
+_PACKAGE_DIR = str(Path(__file__).parent.parent)
+
+
+type Backend = Literal["shelve", "sqlite"]
+
+
+class CorruptedCacheWarning(RuntimeWarning):
+    pass
+
+
+class _ShelfHandle[T](shelve.Shelf[T]):
+    # dbm handles can't be shared between threads or processes: each thread
+    # opens its own, and it's closed by that thread only
+    def __init__(self, db: MutableMapping[bytes, bytes], generation: int) -> None:
+        super().__init__(db)
+        self.pid = os.getpid()
+        self.thread = threading.get_ident()
+        # Of the cache data it was opened for
+        self.generation = generation
+
+    def __del__(self) -> None:
+        if self.pid != os.getpid():
+            # Inherited through a fork and still used by the parent: kept alive
+            # so that it's never closed from the child
+            _inherited_handles.append(self)
+        elif self.thread == threading.get_ident():
+            self.close()
+        # Otherwise the interpreter is dropping the handles of threads still
+        # running at exit, the database is freed without closing it from here
+
 
+_inherited_handles: list[object] = []
+# The handles of each thread, by entity. They're kept out of the cache data so
+# that replacing it never drops them from another thread
+_handles = threading.local()
+_generations = itertools.count()
 
-def _normalize_value(text: str) -> str:
-    text = unicodedata.normalize("NFKD", text)
-    text = "".join(c for c in text if not unicodedata.combining(c))
-    text = unicodedata.normalize("NFC", text)
-    text = text.casefold().replace("♀", "f").replace("♂", "m").replace("œ", "oe")
-    return "".join(c for c in text if unicodedata.category(c)[0] in ("L", "N"))
+
+def _thread_handles() -> dict[type[BaseEntity], _ShelfHandle[BaseEntity]]:
+    try:
+        return cast(
+            "dict[type[BaseEntity], _ShelfHandle[BaseEntity]]", _handles.shelves
+        )
+    except AttributeError:
+        handles: dict[type[BaseEntity], _ShelfHandle[BaseEntity]] = {}
+        _handles.shelves = handles
+        return handles
+
+
+def _close_stale_handles(
+    handles: dict[type[BaseEntity], _ShelfHandle[BaseEntity]],
+) -> None:
+    for entity, handle in list(handles.items()):
+        current = data.get(entity)
+        if current is None or current.generation != handle.generation:
+            del handles[entity]
+            handle.close()
 
 
 @dataclass
 class CacheData[T: BaseEntity]:
     entity: type[T]
-    shelf: shelve.Shelf[T]
+    path: Path
+    backend: Backend = "shelve"
+    database: "sqlite.Database | None" = None
+
+    def __post_init__(self) -> None:
+        self.generation = next(_generations)
+        self._lock = threading.Lock()
+        self._indexes: dict[str, object] = {}
+        self._entries: Mapping[str, T] | None = None
+
+    @property
+    def shelf(self) -> shelve.Shelf[T]:
+        handles = _thread_handles()
+        handle = handles.get(self.entity)
+        if handle is None or handle.generation != self.generation:
+            # The cache was reloaded since this thread last read it: the
+            # handles of the replaced data are closed along the way
+            _close_stale_handles(handles)
+            handle = _ShelfHandle(self._open(), self.generation)
+            handles[self.entity] = handle
+        return cast("shelve.Shelf[T]", handle)
+
+    def _open(self) -> MutableMapping[bytes, bytes]:
+        if self.database is not None:
+            from pokedex.cache import sqlite
 
+            return sqlite.SqliteDict(self.database, self.name)
+        return cast("MutableMapping[bytes, bytes]", dbm.open(self.path, "r"))
+
+    def _load_index[I](
+        self, key: str, freeze: Callable[[I], I], default: I | None = None
+    ) -> I:
+        # Indexes are loaded at most once and never mutated afterwards, so they
+        # can be read without locking and shared copy-on-write after a fork.
+        # Missing ones are remembered as well when there's a default
+        with suppress(KeyError):
+            return cast("I", self._indexes[key])
+        with self._lock:
+            if key not in self._indexes:
+                with metrics.timer(f"index_load.{key.lstrip('_')}", self.name):
+                    try:
+                        index = cast("I", self.shelf[key])
+                    except KeyError:
+                        if default is None:
+                            raise
+                        index = default
+                    self._indexes[key] = freeze(index)
+            return cast("I", self._indexes[key])
+
+    # Cached on the instance once loaded: threads racing on the first access
+    # all get the same index from `_load_index`
     @cached_property
     def index(self) -> Mapping[str, Collection[tuple[Language, str]]]:
-        return self.shelf["_index"]  # type: ignore[return-value]
+        return self._load_index(
+            "_index",
+            lambda x: MappingProxyType({k: frozenset(v) for k, v in x.items()}),
+        )
+
+    @cached_property
+    def species_index(self) -> Mapping[GameGroup, Sequence[str | None]]:
+        return self._load_index(
+            "_species_index",
+            lambda x: MappingProxyType({k: tuple(v) for k, v in x.items()}),
+        )
+
+    @cached_property
+    def form_index(
+        self,
+    ) -> Mapping[GameGroup, Mapping[tuple[int, int], tuple[str, str]]]:
+        return self._load_index(
+            "_form_index",
+            lambda x: MappingProxyType({k: MappingProxyType(v) for k, v in x.items()}),
+        )
+
+    @property
+    def name(self) -> str:
+        return self.entity.yaml_name
+
+    def text_index(self, language: Language) -> TextIndex:
+        # Languages without any description have no index
+        return self._load_index(
+            f"_text_index.{language.value}",
+            lambda x: TextIndex(
+                x.documents,
+                MappingProxyType(
+                    {k: MappingProxyType(v) for k, v in x.postings.items()}
+                ),
+            ),
+            TextIndex(0, {}),
+        )
 
     def __getitem__(self, key: str) -> T:
-        return self.shelf[key]
+        if self._entries is not None:
+            return self._entries[key]
+        if not metrics.enabled:
+            return self.shelf[key]
+
+        # Same as Shelf.__getitem__, split to time the read and the unpickling
+        shelf = self.shelf
+        with metrics.timer("read", self.name):
+            raw = shelf.dict[key.encode(shelf.keyencoding)]  # type: ignore[attr-defined]
+        with metrics.timer("decode", self.name):
+            return cast("T", pickle.loads(raw))
 
     def search(self, name: str) -> Sequence[tuple[Language, EntityRef[T]]]:
+        try:
+            entries = self.index[normalize_value(name)]
+        except KeyError:
+            metrics.record("search_miss", self.name)
+            raise
+        metrics.record("search_hit", self.name)
+        return [
+            (language, EntityRef(self.entity, identifier))
+            for language, identifier in entries
+        ]
+
+    def search_text(
+        self, query: str, language: Language | None = None, limit: int | None = None
+    ) -> Sequence[tuple[Language, EntityRef[T]]]:
+        languages = list(Language) if language is None else [language]
+        scores: dict[tuple[Language, str], float] = {}
+        with metrics.timer("search_text", self.name):
+            for language in languages:
+                tokens = tokenize(query, language, query=True)
+                for identifier, score in self.text_index(language).rank(tokens).items():
+                    scores[language, identifier] = score
+
+        ranked = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
         return [
             (language, EntityRef(self.entity, identifier))
-            for language, identifier in self.index[_normalize_value(name)]
+            for language, identifier in ranked
         ]
 
     def list_identifiers(self) -> Sequence[str]:
+        if self._entries is not None:
+            return list(self._entries)
         return [x for x in self.shelf if not x.startswith("_")]
 
+    def preload(self) -> None:
+        with metrics.timer("preload", self.name):
+            shelf = self.shelf
+            self._entries = MappingProxyType(
+                {x: shelf[x] for x in shelf if not x.startswith("_")}
+            )
+
+    @property
+    def entries(self) -> Mapping[str, T]:
+        if self._entries is None:
+            msg = f"The {self.name} cache is not preloaded"
+            raise ValueError(msg)
+        return self._entries
+
+    def close(self) -> None:
+        # Only the handle of the calling thread, the other ones are closed by
+        # their own thread once stale, or when it exits
+        handles = _thread_handles()
+        handle = handles.get(self.entity)
+        if handle is not None and handle.generation == self.generation:
+            del handles[self.entity]
+            handle.close()
+        if self.database is not None:
+            self.database.close()
+
+    def after_fork_in_child(self) -> None:
+        # The in-memory index is kept and shared copy-on-write with the parent
+        self._lock = threading.Lock()
+
 
 data: dict[type[BaseEntity], CacheData[BaseEntity]] = {}
+_data_lock = threading.Lock()
+# Whether the loaded data was preloaded and frozen, see `_preload`
+_frozen = False
+
+
+type _PendingCalls = weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future[object]]
+]
+
+_executor: "ThreadPoolExecutor | None" = None
+_executor_lock = threading.Lock()
+_pending: _PendingCalls = weakref.WeakKeyDictionary()
+
+
+def _close_all() -> None:
+    # Only the loaded data is closed: registering each one would keep replaced
+    # data (and preloaded graphs) alive until exit
+    for cache_data in data.values():
+        cache_data.close()
+
+
+atexit.register(_close_all)
+
+
+def _after_fork_in_child() -> None:
+    global _data_lock, _executor, _executor_lock, _handles, _pending
+    _data_lock = threading.Lock()
+    # dbm handles are reopened lazily on first use
+    _handles = threading.local()
+    _executor = None
+    _executor_lock = threading.Lock()
+    _pending = weakref.WeakKeyDictionary()
+    for cache_data in data.values():
+        cache_data.after_fork_in_child()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _get_executor() -> "ThreadPoolExecutor":
+    from concurrent.futures import ThreadPoolExecutor
+
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(thread_name_prefix="pokedex")
+    return _executor
+
+
+async def run_in_executor[R](key: Hashable, func: Callable[[], R]) -> R:
+    import asyncio
+
+    # Concurrent calls sharing the same key are coalesced into a single run
+    loop = asyncio.get_running_loop()
+    pending = _pending.setdefault(loop, {})
+    if (future := pending.get(key)) is None:
+        context = contextvars.copy_context()
+        future = loop.run_in_executor(_get_executor(), context.run, func)
+        pending[key] = future
+        future.add_done_callback(lambda _: pending.pop(key, None))
+    return cast("R", await asyncio.shield(future))
+
+
+def process_pool(jobs: int) -> "ProcessPoolExecutor":
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Make sure the cache is built only once, then share it with the workers
+    cache_data = get(Pokemon)
+    return ProcessPoolExecutor(
+        jobs,
+        initializer=load_all,
+        initargs=(cache_data.path.parent, cache_data.backend),
+    )
+
+
+def _remove_temp_dir(path: str, pid: int) -> None:
+    # Forked children inherit atexit handlers, only the creator cleans up
+    if os.getpid() == pid:
+        shutil.rmtree(path, ignore_errors=True)
 
 
 def _build_shelf_index(
@@ -62,49 +367,240 @@ def _build_shelf_index(
         for language, name in entry.names.items():
             if isinstance(language, tuple):
                 language = language[0]
-            index[_normalize_value(name)].add((language, identifier))
+            index[normalize_value(name)].add((language, identifier))
 
     return index
 
 
-def _build_shelf_if_required(entity: type["BaseEntity"], shelf_path: Path) -> None:
-    version = importlib.metadata.version("pokedex")
+def _build_species_indexes(
+    structured_data: EntityMap[Pokemon],
+) -> tuple[
+    Mapping[GameGroup, Sequence[str | None]],
+    Mapping[GameGroup, Mapping[tuple[int, int], tuple[str, str]]],
+]:
+    species_index = defaultdict[GameGroup, list[str | None]](list)
+    form_index = defaultdict[GameGroup, dict[tuple[int, int], tuple[str, str]]](dict)
+    for identifier, pokemon in structured_data.items():
+        for game_group, species_id in pokemon.species_id.items():
+            identifiers = species_index[game_group]
+            if len(identifiers) <= species_id:
+                identifiers.extend([None] * (species_id + 1 - len(identifiers)))
+            identifiers[species_id] = identifier
+
+            for form_identifier, form in pokemon.forms.items():
+                if (form_id := form.form_id.get(game_group)) is not None:
+                    form_index[game_group][species_id, form_id] = (
+                        identifier,
+                        form_identifier,
+                    )
+
+    return species_index, form_index
 
-    with suppress(Exception), shelve.open(shelf_path, "r") as db:
-        if db["_version"] == version:
-            return
 
+def package_version() -> str:
+    # Version of the package, which the cache and snapshots are tied to.
+    # Deferred to keep `import pokedex` fast, a warm cache never needs it
+    import importlib.metadata
+
+    return importlib.metadata.version("pokedex")
+
+
+def _build_entries(
+    entity: type[BaseEntity],
+) -> tuple[EntityMap[BaseEntity], Mapping[str, object]]:
+    # Deferred to keep `import pokedex` fast, a warm cache never needs them
+    import yaml
+
+    from pokedex.cache.converter import converter
+
+    name = entity.yaml_name
     data = {}
-    for file in BaseEntity.yaml_dir.glob(f"*/{entity.yaml_name}.yaml"):
-        with file.open("r", encoding="utf-8") as f:
-            data[file.parent.name] = yaml.safe_load(f)
+    with metrics.timer("build.load_yaml", name):
+        for file in BaseEntity.yaml_dir.glob(f"*/{entity.yaml_name}.yaml"):
+            with file.open("r", encoding="utf-8") as f:
+                data[file.parent.name] = yaml.safe_load(f)
 
-    with shelve.open(shelf_path, "n") as db:
+    with metrics.timer("build.structure", name):
         structured_data = converter.structure(data, EntityMap[entity])  # type: ignore[valid-type]
+
+    with metrics.timer("build.index", name):
+        indexes: dict[str, object] = {"_index": _build_shelf_index(structured_data)}
+        for language, text_index in build_text_indexes(structured_data).items():
+            indexes[f"_text_index.{language.value}"] = text_index
+        if issubclass(entity, Pokemon):
+            species_index, form_index = _build_species_indexes(structured_data)
+            indexes["_species_index"] = species_index
+            indexes["_form_index"] = form_index
+
+    return structured_data, indexes
+
+
+def _report_corruption(name: str, problem: str) -> None:
+    metrics.record("verify.corrupted", name)
+    # Attributed to the first caller outside of the package, whichever path
+    # (load_all, aload_all, a lazy lookup) led to loading the cache
+    warnings.warn(
+        f"The {name} cache is corrupted, rebuilding it: {problem}",
+        CorruptedCacheWarning,
+        skip_file_prefixes=(_PACKAGE_DIR,),
+    )
+
+
+def _shelf_build(shelf_path: Path) -> tuple[object, object] | None:
+    # Version and format stored in a shelf, None if it can't be read
+    try:
+        with shelve.open(shelf_path, "r") as db:
+            return db.get("_version"), db.get("_format")
+    except Exception:
+        return None
+
+
+def _build_shelf_if_required(
+    entity: type["BaseEntity"], shelf_path: Path, verify: Verify
+) -> None:
+    version = package_version()
+
+    # Outdated shelves are rebuilt quietly, damaged ones are reported first.
+    # Shelves built before manifests existed are outdated, a shelf of the
+    # current build missing its manifest was left incomplete
+    current = manifest.read(shelf_path)
+    if current is None:
+        if manifest.sizes(shelf_path):
+            build = _shelf_build(shelf_path)
+            if build is None:
+                _report_corruption(entity.yaml_name, "it can't be read")
+            elif build == (version, _CACHE_FORMAT):
+                _report_corruption(entity.yaml_name, "its manifest is missing")
+    elif (current.version, current.format) == (version, _CACHE_FORMAT):
+        with metrics.timer(f"verify.{verify}", entity.yaml_name):
+            problem = manifest.verify(shelf_path, current, verify)
+        if problem is None:
+            return
+        _report_corruption(entity.yaml_name, problem)
+
+    manifest.remove(shelf_path)
+    structured_data, indexes = _build_entries(entity)
+
+    with (
+        shelve.open(shelf_path, "n") as db,
+        metrics.timer("build.write", entity.yaml_name),
+    ):
         db.update(structured_data)
-        index = _build_shelf_index(structured_data)
-        db["_index"] = index
+        db.update(indexes)
         db["_version"] = version
+        db["_format"] = _CACHE_FORMAT
+
+    manifest.write(shelf_path, version, _CACHE_FORMAT)
+
+
+def _build_database_if_required(database_path: Path, verify: Verify) -> None:
+    # Deferred to keep `import pokedex` fast, only this backend needs it
+    from pokedex.cache import sqlite
+
+    meta = {"version": package_version(), "format": str(_CACHE_FORMAT)}
+    if database_path.exists():
+        with metrics.timer(f"verify.{verify}", database_path.name):
+            problem = sqlite.verify(database_path, verify)
+        if problem is None:
+            if sqlite.read_meta(database_path) == meta:
+                return
+        else:
+            _report_corruption(database_path.name, problem)
+
+    sqlite.build(
+        database_path,
+        ((entity, *_build_entries(entity)) for entity in BaseEntity.__subclasses__()),
+        meta,
+    )
+
 
+def load_all(
+    cache_path: Path | None = None,
+    backend: Backend | None = None,
+    *,
+    preload: bool = False,
+    verify: Verify = "fast",
+) -> None:
+    global _frozen
+    with _data_lock:
+        if _frozen:
+            # The preloaded graph being replaced must be collectable again.
+            # This also thaws anything else frozen since then, which only
+            # costs collections, while keeping it would leak the whole graph
+            gc.unfreeze()
+            _frozen = False
+        _load_all(cache_path, backend, verify)
+        if preload:
+            _preload()
+            _frozen = True
+
+
+async def aload_all(
+    cache_path: Path | None = None,
+    backend: Backend | None = None,
+    *,
+    preload: bool = False,
+    verify: Verify = "fast",
+) -> None:
+    await run_in_executor(
+        ("load_all", cache_path, backend, preload, verify),
+        partial(load_all, cache_path, backend, preload=preload, verify=verify),
+    )
+
+
+def _preload() -> None:
+    # Projections stay lazy: building all of them upfront would double the memory
+    for cache_data in data.values():
+        cache_data.preload()
+    graph.resolve_entity_refs({x: y.entries for x, y in data.items()})
+    gc.freeze()
+
+
+def memory_report() -> Mapping[str, int]:
+    # Approximate size in bytes of the preloaded entries of each entity
+    return graph.memory_usage({x: y.entries for x, y in data.items()})
+
+
+def _load_all(cache_path: Path | None, backend: Backend | None, verify: Verify) -> None:
+    if backend is None:
+        backend = cast("Backend", os.getenv("POKEDEX_DEFAULT_CACHE_BACKEND", "shelve"))
+    if backend not in ("shelve", "sqlite"):
+        msg = f"Unknown cache backend '{backend}'"
+        raise ValueError(msg)
 
-def load_all(cache_path: Path | None = None) -> None:
     if cache_path is None:
         if env_path := os.getenv("POKEDEX_DEFAULT_CACHE_PATH"):
             cache_path = Path(env_path)
         else:
             temp_dir = tempfile.mkdtemp()
-            atexit.register(shutil.rmtree, temp_dir)
+            atexit.register(_remove_temp_dir, temp_dir, os.getpid())
             cache_path = Path(temp_dir)
 
+    if backend == "sqlite":
+        from pokedex.cache import sqlite
+
+        database_path = cache_path / "pokedex.sqlite3"
+        _build_database_if_required(database_path, verify)
+        database = sqlite.Database(database_path)
+
+    previous = list(data.values())
     for entity in BaseEntity.__subclasses__():
-        shelf_path = cache_path / entity.yaml_name
-        _build_shelf_if_required(entity, shelf_path)
-        shelf = shelve.open(shelf_path, "r")  # noqa: SIM115
-        atexit.register(shelf.close)
-        data[entity] = CacheData(entity, shelf)
+        if backend == "sqlite":
+            cache_data = CacheData(entity, database_path, backend, database)
+        else:
+            shelf_path = cache_path / entity.yaml_name
+            _build_shelf_if_required(entity, shelf_path, verify)
+            cache_data = CacheData(entity, shelf_path)
+        data[entity] = cache_data
+
+    # The replaced data isn't reachable from the cache anymore
+    for cache_data in previous:
+        cache_data.close()
 
 
 def get[T: BaseEntity](entity: type[T]) -> CacheData[T]:
     if entity not in data:
-        load_all()
+        with _data_lock:
+            if entity not in data:
+                _load_all(None, None, "fast")
     return cast("CacheData[T]", data[entity])
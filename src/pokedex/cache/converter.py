@@ -1,5 +1,5 @@
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from typing import Any, get_args, get_origin
 
@@ -161,3 +161,97 @@ def _entity_map_hook_factory[T: BaseEntity | SubEntity](
         )
 
     return hook
+
+
+@converter.register_unstructure_hook_factory(
+    lambda tp: tp is Multi or get_origin(tp) is Multi  # type: ignore[comparison-overlap]
+)
+def _multi_unstructure_hook_factory[T](
+    tp: type[Multi[T]], conv: Converter
+) -> Callable[[Multi[T]], Any]:
+    key_handler = conv.get_unstructure_hook(GameGroup)
+    value_handler = conv.get_unstructure_hook(next(iter(get_args(tp)), Any))
+
+    def hook(data: Multi[T]) -> Any:
+        return {key_handler(k): value_handler(v) for k, v in data.items()}
+
+    return hook
+
+
+@converter.register_unstructure_hook_factory(
+    lambda tp: tp is SimpleLocalized or get_origin(tp) is SimpleLocalized  # type: ignore[comparison-overlap]
+)
+def _simple_localized_unstructure_hook_factory[T](
+    tp: type[SimpleLocalized[T]], conv: Converter
+) -> Callable[[SimpleLocalized[T]], Any]:
+    key_handler = conv.get_unstructure_hook(Language)
+    value_handler = conv.get_unstructure_hook(next(iter(get_args(tp)), Any))
+
+    def hook(data: SimpleLocalized[T]) -> Any:
+        return {"common": {key_handler(k): value_handler(v) for k, v in data.items()}}
+
+    return hook
+
+
+@converter.register_unstructure_hook_factory(
+    lambda tp: tp is Localized or get_origin(tp) is Localized  # type: ignore[comparison-overlap]
+)
+def _localized_unstructure_hook_factory[T](
+    tp: type[Localized[T]], conv: Converter
+) -> Callable[[Localized[T]], Any]:
+    language_handler = conv.get_unstructure_hook(Language)
+    game_group_handler = conv.get_unstructure_hook(GameGroup)
+    value_handler = conv.get_unstructure_hook(next(iter(get_args(tp)), Any))
+
+    def hook(data: Localized[T]) -> Any:
+        out: dict[Any, dict[Any, Any]] = defaultdict(dict)
+        for (language, game_group), value in data.items():
+            out[game_group_handler(game_group)][language_handler(language)] = (
+                value_handler(value)
+            )
+        return dict(out)
+
+    return hook
+
+
+@converter.register_unstructure_hook_factory(
+    lambda tp: get_origin(tp) is MaybeGameMapping  # type: ignore[comparison-overlap]
+)
+def _maybe_game_mapping_unstructure_hook_factory[T](
+    tp: type[MaybeGameMapping[T]], conv: Converter
+) -> Callable[[MaybeGameMapping[T]], Any]:
+    key_handler = conv.get_unstructure_hook(Game)
+    value_handler = conv.get_unstructure_hook(get_args(tp)[0])
+
+    def hook(data: MaybeGameMapping[T]) -> Any:
+        if isinstance(data, Mapping):
+            return {key_handler(k): value_handler(v) for k, v in data.items()}
+        return value_handler(data)
+
+    return hook
+
+
+@converter.register_unstructure_hook_factory(
+    lambda tp: tp is EntityRef or get_origin(tp) is EntityRef  # type: ignore[comparison-overlap]
+)
+def _entity_ref_unstructure_hook_factory[T: BaseEntity](
+    tp: type[EntityRef[T]], conv: Converter
+) -> Callable[[EntityRef[T]], Any]:
+    def hook(data: EntityRef[T]) -> Any:
+        return data.identifier
+
+    return hook
+
+
+@converter.register_unstructure_hook_factory(
+    lambda tp: tp is EntityMap or get_origin(tp) is EntityMap  # type: ignore[comparison-overlap]
+)
+def _entity_map_unstructure_hook_factory[T: BaseEntity | SubEntity](
+    tp: type[EntityMap[T]], conv: Converter
+) -> Callable[[EntityMap[T]], Any]:
+    value_handler = conv.get_unstructure_hook(next(iter(get_args(tp)), Any))
+
+    def hook(data: EntityMap[T]) -> Any:
+        return {k: value_handler(v) for k, v in data.items()}
+
+    return hook
@@ -0,0 +1,57 @@
+import gc
+import sys
+from collections.abc import Iterator, Mapping
+from enum import Enum
+from types import FunctionType, ModuleType, NoneType
+
+from pokedex.entities.base import BaseEntity, EntityRef
+
+# Shared by the whole process rather than owned by any entry
+_SHARED_TYPES = (type, Enum, FunctionType, ModuleType, NoneType, bool)
+
+
+def _walk(
+    roots: list[object], seen: set[int], *, containers_only: bool = False
+) -> Iterator[object]:
+    stack = roots
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        yield obj
+        if isinstance(obj, EntityRef):
+            # The target belongs to another entry, possibly of another entity
+            stack.append(obj.identifier)
+        elif containers_only:
+            # Entity references are unhashable, so they're never dict keys, and
+            # objects untracked by the garbage collector can't hold any
+            children = obj.values() if type(obj) is dict else gc.get_referents(obj)
+            stack.extend(x for x in children if gc.is_tracked(x))
+        elif not isinstance(obj, str | int | float):
+            stack.extend(gc.get_referents(obj))
+
+
+def resolve_entity_refs(
+    entries: Mapping[type[BaseEntity], Mapping[str, BaseEntity]],
+) -> None:
+    seen = set[int]()
+    for entity_entries in entries.values():
+        roots: list[object] = list(entity_entries.values())
+        for obj in _walk(roots, seen, containers_only=True):
+            if isinstance(obj, EntityRef):
+                obj.target = entries[obj.entity][obj.identifier]
+
+
+def memory_usage(
+    entries: Mapping[type[BaseEntity], Mapping[str, BaseEntity]],
+) -> Mapping[str, int]:
+    # Objects shared between entity types are only counted in the first one
+    seen = set[int]()
+    return {
+        entity.yaml_name: sum(
+            sys.getsizeof(obj)
+            for obj in _walk([entity_entries, *entity_entries.values()], seen)
+        )
+        for entity, entity_entries in entries.items()
+    }
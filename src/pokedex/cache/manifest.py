@@ -0,0 +1,108 @@
+import dbm
+import hashlib
+import json
+import os
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal, cast
+
+type Verify = Literal["fast", "full"]
+
+# Files a dbm database can be made of, depending on the implementation in use
+_SUFFIXES = ("", ".db", ".dat", ".dir")
+
+
+@dataclass(frozen=True, slots=True)
+class Manifest:
+    version: str
+    format: int
+    records: int
+    checksum: str
+    sizes: dict[str, int]
+
+
+def _path(shelf_path: Path) -> Path:
+    return shelf_path.with_name(f"{shelf_path.name}.manifest.json")
+
+
+def sizes(shelf_path: Path) -> dict[str, int]:
+    result = {}
+    for suffix in _SUFFIXES:
+        path = shelf_path.with_name(shelf_path.name + suffix)
+        if path.is_file():
+            result[path.name] = path.stat().st_size
+    return result
+
+
+def _checksum(shelf_path: Path) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    with dbm.open(shelf_path, "r") as db:
+        keys = sorted(cast("list[bytes]", db.keys()))
+        for key in keys:
+            for chunk in (key, db[key]):
+                digest.update(len(chunk).to_bytes(8))
+                digest.update(chunk)
+    return len(keys), digest.hexdigest()
+
+
+def create_temp(path: Path) -> tuple[int, Path]:
+    # Creates a file next to `path`, to be moved in place once written. Unlike
+    # mkstemp (always 0o600), its permissions follow the umask like any other
+    # file, so that a cache can be shared with other users
+    while True:
+        temp_path = path.with_name(f"{path.name}.{os.urandom(6).hex()}.tmp")
+        with suppress(FileExistsError):
+            flags = os.O_RDWR | os.O_CREAT | os.O_EXCL
+            return os.open(temp_path, flags, 0o666), temp_path
+
+
+def remove(shelf_path: Path) -> None:
+    _path(shelf_path).unlink(missing_ok=True)
+
+
+def write(shelf_path: Path, version: str, cache_format: int) -> None:
+    records, checksum = _checksum(shelf_path)
+    manifest = Manifest(version, cache_format, records, checksum, sizes(shelf_path))
+
+    # Written last and moved in place, so that its presence means that the
+    # shelf was built completely
+    path = _path(shelf_path)
+    fd, temp_path = create_temp(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(asdict(manifest), f)
+        temp_path.replace(path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def read(shelf_path: Path) -> Manifest | None:
+    try:
+        with _path(shelf_path).open(encoding="utf-8") as f:
+            return Manifest(**json.load(f))
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def verify(shelf_path: Path, manifest: Manifest, mode: Verify) -> str | None:
+    # Returns what's wrong with the shelf, if anything. The fast mode only
+    # catches truncated or replaced files, the full one reads every record
+    if (current_sizes := sizes(shelf_path)) != manifest.sizes:
+        return f"file sizes {current_sizes} don't match {manifest.sizes}"
+
+    try:
+        if mode == "fast":
+            with dbm.open(shelf_path, "r") as db:
+                records = len(db)
+            checksum = manifest.checksum
+        else:
+            records, checksum = _checksum(shelf_path)
+    except dbm.error as e:  # Includes the damaged files dbm can't identify
+        return f"the shelf can't be read ({e})"
+
+    if records != manifest.records:
+        return f"{records} records found, {manifest.records} expected"
+    if checksum != manifest.checksum:
+        return "checksum mismatch"
+    return None
@@ -0,0 +1,114 @@
+import bisect
+import os
+import threading
+import time
+import warnings
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+
+# Upper bounds, in seconds, of the timing histogram buckets
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, float("inf"))
+
+type Hook = Callable[[str, str, float | None], None]
+
+
+@dataclass
+class Metric:
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * len(BUCKETS))
+
+    def observe(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+        self.buckets[bisect.bisect_left(BUCKETS, duration)] += 1
+
+
+enabled = False
+
+_lock = threading.Lock()
+_metrics: dict[str, dict[str, Metric]] = {}
+_hooks: list[Hook] = []
+
+
+def _after_fork_in_child() -> None:
+    # The lock may have been held by another thread of the parent
+    global _lock
+    _lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def enable() -> None:
+    global enabled
+    enabled = True
+
+
+def disable() -> None:
+    global enabled
+    enabled = False
+
+
+def reset() -> None:
+    with _lock:
+        _metrics.clear()
+
+
+def add_hook(hook: Hook) -> None:
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Hook) -> None:
+    _hooks.remove(hook)
+
+
+def stats() -> Mapping[str, Mapping[str, Metric]]:
+    with _lock:
+        return {
+            entity: {
+                name: replace(metric, buckets=list(metric.buckets))
+                for name, metric in metrics.items()
+            }
+            for entity, metrics in _metrics.items()
+        }
+
+
+def record(name: str, entity: str, duration: float | None = None) -> None:
+    if not enabled:
+        return
+
+    with _lock:
+        metric = _metrics.setdefault(entity, {}).setdefault(name, Metric())
+        if duration is None:
+            metric.count += 1
+        else:
+            metric.observe(duration)
+
+    # A failing hook must not break the cache read being measured
+    for hook in _hooks:
+        try:
+            hook(name, entity, duration)
+        except Exception as e:
+            warnings.warn(
+                f"Metrics hook {hook!r} failed: {e!r}", RuntimeWarning, stacklevel=2
+            )
+
+
+@contextmanager
+def timer(name: str, entity: str) -> Iterator[None]:
+    if not enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, entity, time.perf_counter() - start)
@@ -0,0 +1,333 @@
+import os
+import pickle
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping, MutableMapping, Sequence
+from contextlib import closing, suppress
+from dataclasses import fields
+from pathlib import Path
+from typing import cast
+
+from pokedex import cache
+from pokedex.cache import manifest
+from pokedex.cache.manifest import Verify
+from pokedex.cache.text import normalize_value
+from pokedex.entities.base import BaseEntity, EntityMap, EntityRef, Localized, Multi
+from pokedex.entities.pokemon import Pokemon
+from pokedex.enums import GameGroup, Language
+
+# Besides the pickled entries backing `BaseEntity.get` and `search`, the
+# database has normalized tables meant to be queried directly:
+#
+#   names(entity, identifier, language, game_group, name, normalized)
+#   game_groups(entity, identifier, game_group, game_group_order)
+#   pokemon_forms(game_group, species_id, form_id, pokemon, form)
+#   names_fts(name), an FTS5 index over `names` when SQLite supports it
+SCHEMA = """
+    CREATE TABLE meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    ) WITHOUT ROWID;
+
+    CREATE TABLE entries (
+        entity TEXT NOT NULL,
+        key TEXT NOT NULL,
+        data BLOB NOT NULL,
+        PRIMARY KEY (entity, key)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE names (
+        entity TEXT NOT NULL,
+        identifier TEXT NOT NULL,
+        language TEXT NOT NULL,
+        game_group TEXT,
+        name TEXT NOT NULL,
+        normalized TEXT NOT NULL
+    );
+    CREATE INDEX names_normalized ON names (entity, normalized);
+    CREATE INDEX names_language ON names (entity, language, normalized);
+
+    CREATE TABLE game_groups (
+        entity TEXT NOT NULL,
+        identifier TEXT NOT NULL,
+        game_group TEXT NOT NULL,
+        game_group_order INTEGER NOT NULL,
+        PRIMARY KEY (entity, identifier, game_group)
+    ) WITHOUT ROWID;
+    CREATE INDEX game_groups_game_group ON game_groups (entity, game_group);
+
+    CREATE TABLE pokemon_forms (
+        game_group TEXT NOT NULL,
+        species_id INTEGER NOT NULL,
+        form_id INTEGER NOT NULL,
+        pokemon TEXT NOT NULL,
+        form TEXT NOT NULL,
+        PRIMARY KEY (game_group, species_id, form_id)
+    ) WITHOUT ROWID;
+"""
+
+FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE names_fts USING fts5(
+        name, content='names', content_rowid='rowid'
+    );
+    INSERT INTO names_fts (names_fts) VALUES ('rebuild');
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    # Not tied to its thread, so that it can be closed from any of them
+    return sqlite3.connect(
+        f"{path.absolute().as_uri()}?mode=ro", uri=True, check_same_thread=False
+    )
+
+
+_inherited_connections: list[sqlite3.Connection] = []
+
+
+class _Connection:
+    # Closed once dropped: when its thread exits, or the database is closed
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.pid = os.getpid()
+        self.connection = connection
+
+    def __del__(self) -> None:
+        if self.pid == os.getpid():
+            self.connection.close()
+        else:
+            # Still owned by the parent: kept alive so that it's never closed
+            # from the child
+            _inherited_connections.append(self.connection)
+
+
+class Database:
+    # Read-only access shared by every entity, backing both the shelves and
+    # the queries below
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        # Connections can't be shared between processes and each thread of each
+        # process gets its own
+        handle = cast("_Connection | None", getattr(self._local, "handle", None))
+        if handle is None or handle.pid != os.getpid():
+            handle = self._local.handle = _Connection(connect(self.path))
+        return handle.connection
+
+    def close(self) -> None:
+        with suppress(AttributeError):
+            del self._local.handle
+
+
+class SqliteDict(MutableMapping[bytes, bytes]):
+    # Read-only stand-in for a dbm database, so that a shelf can sit on top of it
+    def __init__(self, database: Database, entity: str) -> None:
+        self.database = database
+        self.entity = entity
+
+    def __getitem__(self, key: bytes) -> bytes:
+        row = self.database.connection.execute(
+            "SELECT data FROM entries WHERE entity = ? AND key = ?",
+            (self.entity, key.decode()),
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return cast("bytes", row[0])
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        msg = "The database is read-only"
+        raise TypeError(msg)
+
+    def __delitem__(self, key: bytes) -> None:
+        msg = "The database is read-only"
+        raise TypeError(msg)
+
+    def __iter__(self) -> Iterator[bytes]:
+        for (key,) in self.database.connection.execute(
+            "SELECT key FROM entries WHERE entity = ?", (self.entity,)
+        ):
+            yield key.encode()
+
+    def __len__(self) -> int:
+        row = self.database.connection.execute(
+            "SELECT COUNT(*) FROM entries WHERE entity = ?", (self.entity,)
+        ).fetchone()
+        return cast("int", row[0])
+
+    def close(self) -> None:
+        # The connection belongs to the database
+        pass
+
+
+def read_meta(path: Path) -> Mapping[str, str]:
+    with suppress(sqlite3.Error), closing(connect(path)) as connection:
+        return dict(connection.execute("SELECT key, value FROM meta"))
+    return {}
+
+
+def verify(path: Path, mode: Verify) -> str | None:
+    # Returns what's wrong with the database, if anything. The fast mode only
+    # catches truncated files, the full one checks every page
+    try:
+        with closing(connect(path)) as connection:
+            ((page_count,),) = connection.execute("PRAGMA page_count")
+            ((page_size,),) = connection.execute("PRAGMA page_size")
+            if (size := path.stat().st_size) != page_count * page_size:
+                return f"{size} bytes found, {page_count * page_size} expected"
+            if mode == "full":
+                result = "\n".join(
+                    x for (x,) in connection.execute("PRAGMA integrity_check")
+                )
+                if result != "ok":
+                    return f"the integrity check failed ({result})"
+    except (OSError, sqlite3.Error) as e:
+        return f"the database can't be read ({e})"
+    return None
+
+
+def _names_rows(
+    entity: type[BaseEntity], structured_data: EntityMap[BaseEntity]
+) -> Iterator[tuple[str, str, str, str | None, str, str]]:
+    for identifier, entry in structured_data.items():
+        assert hasattr(entry, "names")
+        for key, name in entry.names.items():
+            language, game_group = key if isinstance(key, tuple) else (key, None)
+            yield (
+                entity.yaml_name,
+                identifier,
+                language.value,
+                game_group.value if game_group else None,
+                name,
+                normalize_value(name),
+            )
+
+
+def _game_groups_rows(
+    entity: type[BaseEntity], structured_data: EntityMap[BaseEntity]
+) -> Iterator[tuple[str, str, str, int]]:
+    for identifier, entry in structured_data.items():
+        game_groups = set[GameGroup]()
+        for field in fields(entry):
+            value = getattr(entry, field.name)
+            if isinstance(value, Multi):
+                game_groups.update(value)
+            elif isinstance(value, Localized):
+                game_groups.update(game_group for _, game_group in value)
+        for game_group in game_groups:
+            yield entity.yaml_name, identifier, game_group.value, game_group.order
+
+
+def build(
+    path: Path,
+    entries: Iterable[
+        tuple[type[BaseEntity], EntityMap[BaseEntity], Mapping[str, object]]
+    ],
+    meta: Mapping[str, str],
+) -> None:
+    # Built next to the destination and moved in place, so that readers never
+    # see a partially written database
+    fd, temp_path = manifest.create_temp(path)
+    os.close(fd)
+    try:
+        with closing(sqlite3.connect(temp_path)) as connection:
+            connection.executescript(SCHEMA)
+            for entity, structured_data, indexes in entries:
+                connection.executemany(
+                    "INSERT INTO entries VALUES (?, ?, ?)",
+                    (
+                        (entity.yaml_name, key, pickle.dumps(value))
+                        for key, value in {**structured_data, **indexes}.items()
+                    ),
+                )
+                connection.executemany(
+                    "INSERT INTO names VALUES (?, ?, ?, ?, ?, ?)",
+                    _names_rows(entity, structured_data),
+                )
+                connection.executemany(
+                    "INSERT INTO game_groups VALUES (?, ?, ?, ?)",
+                    _game_groups_rows(entity, structured_data),
+                )
+                if issubclass(entity, Pokemon):
+                    form_index = cast(
+                        "Mapping[GameGroup, Mapping[tuple[int, int], tuple[str, str]]]",
+                        indexes["_form_index"],
+                    )
+                    connection.executemany(
+                        "INSERT INTO pokemon_forms VALUES (?, ?, ?, ?, ?)",
+                        (
+                            (game_group.value, *ids, *identifiers)
+                            for game_group, forms in form_index.items()
+                            for ids, identifiers in forms.items()
+                        ),
+                    )
+            with suppress(sqlite3.OperationalError):  # SQLite built without FTS5
+                connection.executescript(FTS_SCHEMA)
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+            connection.commit()
+            connection.execute("VACUUM")
+        temp_path.replace(path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _connection(entity: type[BaseEntity]) -> sqlite3.Connection:
+    if (database := cache.get(entity).database) is None:
+        msg = "The cache is not using the sqlite backend"
+        raise ValueError(msg)
+    return database.connection
+
+
+def query(
+    sql: str, parameters: Sequence[object] | Mapping[str, object] = ()
+) -> list[tuple[object, ...]]:
+    # Every entity shares the same database
+    connection = _connection(Pokemon)
+    return connection.execute(sql, parameters).fetchall()
+
+
+def names_starting_with[T: BaseEntity](
+    entity: type[T], prefix: str, language: Language | None = None
+) -> Sequence[tuple[Language, EntityRef[T]]]:
+    normalized = normalize_value(prefix)
+    sql = """
+        SELECT DISTINCT language, identifier FROM names
+        WHERE entity = ? AND normalized >= ? AND normalized < ?
+    """
+    parameters = [entity.yaml_name, normalized, normalized + "\U0010ffff"]
+    if language is not None:
+        sql += " AND language = ?"
+        parameters.append(language.value)
+    rows = _connection(entity).execute(sql + " ORDER BY normalized", parameters)
+    return [(Language(x), EntityRef(entity, y)) for x, y in rows]
+
+
+def introduced_in[T: BaseEntity](
+    entity: type[T], game_group: GameGroup
+) -> Sequence[EntityRef[T]]:
+    rows = _connection(entity).execute(
+        """
+        SELECT identifier FROM game_groups
+        WHERE entity = ?
+        GROUP BY identifier
+        HAVING MIN(game_group_order) = ?
+        ORDER BY identifier
+        """,
+        (entity.yaml_name, game_group.order),
+    )
+    return [EntityRef(entity, x) for (x,) in rows]
+
+
+def match_names[T: BaseEntity](
+    entity: type[T], match: str
+) -> Sequence[tuple[Language, EntityRef[T]]]:
+    rows = _connection(entity).execute(
+        """
+        SELECT DISTINCT names.language, names.identifier
+        FROM names_fts JOIN names ON names.rowid = names_fts.rowid
+        WHERE names_fts MATCH ? AND names.entity = ?
+        ORDER BY names_fts.rank
+        """,
+        (match, entity.yaml_name),
+    )
+    return [(Language(x), EntityRef(entity, y)) for x, y in rows]
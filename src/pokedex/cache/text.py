@@ -0,0 +1,103 @@
+import math
+import re
+import unicodedata
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, fields
+
+from pokedex.entities.base import BaseEntity, EntityMap, Localized, SubEntity
+from pokedex.enums import Language
+
+# Languages written without spaces between words (or, for Korean, with
+# particles glued to them) are indexed as character n-grams instead of words
+_NGRAM_LANGUAGES = frozenset(
+    {
+        Language.JAPANESE_KANA,
+        Language.JAPANESE_KANJI,
+        Language.KOREAN,
+        Language.CHINESE_SIMPLIFIED,
+        Language.CHINESE_TRADITIONAL,
+    }
+)
+
+_WORD_SEPARATOR_RE = re.compile(r"[\W_]+")
+
+
+@dataclass(frozen=True, slots=True)
+class TextIndex:
+    documents: int
+    postings: Mapping[str, Mapping[str, int]]
+
+    def rank(self, tokens: Iterable[str]) -> dict[str, float]:
+        # tf-idf: rarer terms weigh more, repeating a term has diminishing returns
+        scores = defaultdict[str, float](float)
+        for token in set(tokens):
+            if not (postings := self.postings.get(token)):
+                continue
+            idf = math.log(1 + self.documents / len(postings))
+            for identifier, count in postings.items():
+                scores[identifier] += (1 + math.log(count)) * idf
+        return scores
+
+
+def normalize_value(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    text = unicodedata.normalize("NFC", text)
+    text = text.casefold().replace("♀", "f").replace("♂", "m").replace("œ", "oe")
+    return "".join(c for c in text if unicodedata.category(c)[0] in ("L", "N"))
+
+
+def tokenize(text: str, language: Language, *, query: bool = False) -> list[str]:
+    words = [normalize_value(x) for x in _WORD_SEPARATOR_RE.split(text)]
+    if language not in _NGRAM_LANGUAGES:
+        return [x for x in words if x]
+
+    tokens = []
+    for word in words:
+        bigrams = [word[i : i + 2] for i in range(len(word) - 1)]
+        if query and bigrams:
+            # Bigrams alone are enough to find longer terms
+            tokens.extend(bigrams)
+        else:
+            tokens.extend(word)
+            tokens.extend(bigrams)
+    return tokens
+
+
+def _iter_descriptions(entry: BaseEntity | SubEntity) -> Iterator[tuple[Language, str]]:
+    for field in fields(entry):
+        value = getattr(entry, field.name)
+        if field.name == "descriptions" and isinstance(value, Localized):
+            for (language, _), text in value.items():
+                if isinstance(text, Mapping):
+                    yield from ((language, x) for x in text.values())
+                else:
+                    yield language, text
+        elif isinstance(value, EntityMap):
+            for subentry in value.values():
+                yield from _iter_descriptions(subentry)
+
+
+def build_text_indexes(
+    structured_data: EntityMap[BaseEntity],
+) -> Mapping[Language, TextIndex]:
+    indexes = defaultdict[Language, dict[str, dict[str, int]]](dict)
+    documents = defaultdict[Language, int](int)
+    for identifier, entry in structured_data.items():
+        texts = defaultdict[Language, set[str]](set)
+        for language, text in _iter_descriptions(entry):
+            texts[language].add(text)
+
+        for language, language_texts in texts.items():
+            documents[language] += 1
+            index = indexes[language]
+            for text in language_texts:
+                for token in tokenize(text, language):
+                    postings = index.setdefault(token, {})
+                    postings[identifier] = postings.get(identifier, 0) + 1
+
+    return {
+        language: TextIndex(documents[language], postings)
+        for language, postings in indexes.items()
+    }
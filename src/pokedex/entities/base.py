@@ -1,8 +1,9 @@
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import ClassVar, Self, overload
+from typing import ClassVar, Self, cast, overload
 
 from pokedex import cache
 from pokedex.context import context_game_group, context_language
@@ -10,9 +11,26 @@ from pokedex.enums import Game, GameGroup, Language
 
 
 class _BaseMulti[K, V](Mapping[K, V]):
+    # Derived views are built on first use and reused, the data never changes.
+    # See `pokedex.cache._preload` about preloaded values shared with children
+    _projections: dict[Hashable, object] | None = None
+
     def __init__(self, data: Mapping[K, V]) -> None:
         self._data = dict(data)
 
+    def __getstate__(self) -> dict[str, object]:
+        # Projections are left out, they're rebuilt on demand
+        return {"_data": self._data}
+
+    def _projection[P](self, key: Hashable, build: Callable[[], P]) -> P:
+        if self._projections is None:
+            self._projections = {}
+        try:
+            return cast("P", self._projections[key])
+        except KeyError:
+            projection = self._projections[key] = build()
+            return projection
+
     def __repr__(self) -> str:
         cls = type(self)
         return f"{cls.__module__}.{cls.__qualname__}({self._data!r})"
@@ -52,19 +70,25 @@ class _BaseMulti[K, V](Mapping[K, V]):
         return default
 
     def single(self) -> V:
-        if not self:
+        groups = self._groups()
+        if not groups:
             msg = "The mapping is empty."
             raise ValueError(msg)
 
-        values = iter(self.values())
-        first = next(values)
-        if all(x == first for x in values):
-            return first
+        if len(groups) == 1:
+            return groups[0][1]
 
         msg = "Not all values are the same."
         raise ValueError(msg)
 
     def group(self) -> list[tuple[set[K], V]]:
+        # The caller owns the returned list and sets, the cached groups stay intact
+        return [(set(keys), val) for keys, val in self._groups()]
+
+    def _groups(self) -> Sequence[tuple[frozenset[K], V]]:
+        return self._projection("group", self._build_groups)
+
+    def _build_groups(self) -> Sequence[tuple[frozenset[K], V]]:
         groups: list[tuple[set[K], V]] = []
         for key, val in self.items():
             group_key = next((k for k, v in groups if v == val), None)
@@ -72,7 +96,7 @@ class _BaseMulti[K, V](Mapping[K, V]):
                 group_key.add(key)
             else:
                 groups.append(({key}, val))
-        return groups
+        return tuple((frozenset(keys), val) for keys, val in groups)
 
 
 class Multi[V](_BaseMulti[GameGroup, V]):
@@ -140,23 +164,29 @@ class Localized[V](_BaseMulti[tuple[Language, GameGroup], V]):
     def with_language(self, key: Language | None = None) -> Multi[V]:
         if key is None:
             key = context_language.get()
-        return Multi(
-            {
-                game_group: value
-                for (language, game_group), value in self._data.items()
-                if language is key
-            }
+        return self._projection(
+            key,
+            lambda: Multi(
+                {
+                    game_group: value
+                    for (language, game_group), value in self._data.items()
+                    if language is key
+                }
+            ),
         )
 
     def with_game_group(self, key: GameGroup | None = None) -> SimpleLocalized[V]:
         if key is None:
             key = context_game_group.get()
-        return SimpleLocalized(
-            {
-                language: value
-                for (language, game_group), value in self._data.items()
-                if game_group is key
-            }
+        return self._projection(
+            key,
+            lambda: SimpleLocalized(
+                {
+                    language: value
+                    for (language, game_group), value in self._data.items()
+                    if game_group is key
+                }
+            ),
         )
 
 
@@ -167,10 +197,17 @@ type MaybeGameMapping[T] = T | Mapping[Game, T]
 
 
 class EntityRef[T: "BaseEntity"]:
+    # Set when the cache is preloaded, see `pokedex.cache.load_all`
+    target: T | None = None
+
     def __init__(self, entity: type[T], identifier: str) -> None:
         self.entity = entity
         self.identifier = identifier
 
+    def __reduce__(self) -> tuple[type[Self], tuple[type[T], str]]:
+        # The target is left out, it's resolved again by the receiving process
+        return type(self), (self.entity, self.identifier)
+
     def __repr__(self) -> str:
         cls = type(self)
         ent = self.entity
@@ -185,6 +222,8 @@ class EntityRef[T: "BaseEntity"]:
         return NotImplemented
 
     def get(self) -> T:
+        if self.target is not None:
+            return self.target
         return self.entity.get(self.identifier)
 
 
@@ -203,10 +242,43 @@ class BaseEntity:
     def search(cls, name: str) -> Sequence[tuple[Language, EntityRef[Self]]]:
         return cache.get(cls).search(name)
 
+    @classmethod
+    def search_text(
+        cls, query: str, language: Language | None = None, limit: int | None = None
+    ) -> Sequence[tuple[Language, EntityRef[Self]]]:
+        return cache.get(cls).search_text(query, language, limit)
+
     @classmethod
     def list_identifiers(cls) -> Sequence[str]:
         return cache.get(cls).list_identifiers()
 
+    @classmethod
+    async def aget(cls, identifier: str) -> Self:
+        return await cache.run_in_executor(
+            (cls, "get", identifier), partial(cls.get, identifier)
+        )
+
+    @classmethod
+    async def asearch(cls, name: str) -> Sequence[tuple[Language, EntityRef[Self]]]:
+        return await cache.run_in_executor(
+            (cls, "search", name), partial(cls.search, name)
+        )
+
+    @classmethod
+    async def asearch_text(
+        cls, query: str, language: Language | None = None, limit: int | None = None
+    ) -> Sequence[tuple[Language, EntityRef[Self]]]:
+        return await cache.run_in_executor(
+            (cls, "search_text", query, language, limit),
+            partial(cls.search_text, query, language, limit),
+        )
+
+    @classmethod
+    async def alist_identifiers(cls) -> Sequence[str]:
+        return await cache.run_in_executor(
+            (cls, "list_identifiers"), cls.list_identifiers
+        )
+
 
 @dataclass
 class SubEntity:
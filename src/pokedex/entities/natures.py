@@ -1,6 +1,30 @@
 from dataclasses import dataclass
 
 from pokedex.entities.base import BaseEntity, Localized
+from pokedex.enums import Stat
+
+# Natures form a grid: each one raises the stat of its row and lowers the stat
+# of its column by 10%, the ones on the diagonal have no effect
+_NATURE_GRID = (
+    ("hardy", "lonely", "brave", "adamant", "naughty"),
+    ("bold", "docile", "relaxed", "impish", "lax"),
+    ("timid", "hasty", "serious", "jolly", "naive"),
+    ("modest", "mild", "quiet", "bashful", "rash"),
+    ("calm", "gentle", "sassy", "careful", "quirky"),
+)
+_NATURE_GRID_STATS = (
+    Stat.ATTACK,
+    Stat.DEFENSE,
+    Stat.SPEED,
+    Stat.SPECIAL_ATTACK,
+    Stat.SPECIAL_DEFENSE,
+)
+_MODIFIED_STATS = {
+    identifier: (increased, decreased)
+    for increased, row in zip(_NATURE_GRID_STATS, _NATURE_GRID, strict=True)
+    for decreased, identifier in zip(_NATURE_GRID_STATS, row, strict=True)
+    if increased is not decreased
+}
 
 
 @dataclass
@@ -8,3 +32,11 @@ class Nature(BaseEntity):
     yaml_name = "natures"
 
     names: Localized[str]
+
+    @property
+    def increased_stat(self) -> Stat | None:
+        return _MODIFIED_STATS.get(self.identifier, (None, None))[0]
+
+    @property
+    def decreased_stat(self) -> Stat | None:
+        return _MODIFIED_STATS.get(self.identifier, (None, None))[1]
@@ -1,6 +1,9 @@
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from typing import Self
 
+from pokedex import cache
+from pokedex.context import context_game_group
 from pokedex.entities.abilities import Ability
 from pokedex.entities.base import (
     BaseEntity,
@@ -15,7 +18,7 @@ from pokedex.entities.base import (
 from pokedex.entities.egg_groups import EggGroup
 from pokedex.entities.items import Item
 from pokedex.entities.types import Type
-from pokedex.enums import HeldItemSlot, Stat
+from pokedex.enums import GameGroup, HeldItemSlot, Stat
 
 
 @dataclass
@@ -51,3 +54,27 @@ class Pokemon(BaseEntity):
     names: Localized[str]
     forms: EntityMap[PokemonForm]
     gmax_forms: EntityMap[PokemonGmaxForm] = field(default_factory=EntityMap)
+
+    @classmethod
+    def get_by_species_id(
+        cls, species_id: int, game_group: GameGroup | None = None
+    ) -> Self:
+        if game_group is None:
+            game_group = context_game_group.get()
+        identifiers = cache.get(cls).species_index.get(game_group, ())
+        if 0 <= species_id < len(identifiers) and (
+            identifier := identifiers[species_id]
+        ):
+            return cls.get(identifier)
+        raise KeyError(species_id)
+
+    @classmethod
+    def get_by_form_id(
+        cls, species_id: int, form_id: int, game_group: GameGroup | None = None
+    ) -> tuple[Self, PokemonForm]:
+        if game_group is None:
+            game_group = context_game_group.get()
+        forms = cache.get(cls).form_index.get(game_group, {})
+        identifier, form_identifier = forms[species_id, form_id]
+        pokemon = cls.get(identifier)
+        return pokemon, pokemon.forms[form_identifier]
@@ -0,0 +1,114 @@
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import fields
+from pathlib import Path
+from typing import Literal, TextIO
+
+from pokedex import cache
+from pokedex.cache.converter import converter
+from pokedex.entities.base import (
+    BaseEntity,
+    EntityRef,
+    Localized,
+    Multi,
+    SimpleLocalized,
+    SubEntity,
+)
+from pokedex.enums import GameGroup, Language
+
+type ExportFormat = Literal["jsonl", "csv"]
+
+CSV_HEADER = ("identifier", "field", "game_group", "language", "value")
+
+
+def _flatten(
+    value: object,
+    path: str,
+    game_group: GameGroup | None = None,
+    language: Language | None = None,
+) -> Iterator[tuple[str, GameGroup | None, Language | None, object]]:
+    if isinstance(value, Localized):
+        for (key_language, key_game_group), subvalue in value.items():
+            yield from _flatten(subvalue, path, key_game_group, key_language)
+    elif isinstance(value, Multi):
+        for key_game_group, subvalue in value.items():
+            yield from _flatten(subvalue, path, key_game_group, language)
+    elif isinstance(value, SimpleLocalized):
+        for key_language, subvalue in value.items():
+            yield from _flatten(subvalue, path, game_group, key_language)
+    elif isinstance(value, EntityRef):
+        yield path, game_group, language, value.identifier
+    elif isinstance(value, BaseEntity | SubEntity):
+        for field in fields(value):
+            if field.name != "identifier":
+                subpath = f"{path}.{field.name}" if path else field.name
+                yield from _flatten(
+                    getattr(value, field.name), subpath, game_group, language
+                )
+    elif isinstance(value, Mapping):
+        for key, subvalue in value.items():
+            subpath = f"{path}.{converter.unstructure(key)}"
+            yield from _flatten(subvalue, subpath, game_group, language)
+    elif isinstance(value, list | tuple):
+        for i, subvalue in enumerate(value):
+            yield from _flatten(subvalue, f"{path}.{i}", game_group, language)
+    elif value is not None:
+        yield path, game_group, language, converter.unstructure(value)
+
+
+def export_jsonl(entity: type[BaseEntity], f: TextIO) -> None:
+    for identifier in entity.list_identifiers():
+        entry = converter.unstructure(entity.get(identifier))
+        f.write(json.dumps(entry, ensure_ascii=False))
+        f.write("\n")
+
+
+def export_csv(entity: type[BaseEntity], f: TextIO) -> None:
+    writer = csv.writer(f, lineterminator="\n")
+    writer.writerow(CSV_HEADER)
+    for identifier in entity.list_identifiers():
+        writer.writerows(
+            (
+                identifier,
+                path,
+                game_group.value if game_group else "",
+                language.value if language else "",
+                value,
+            )
+            for path, game_group, language, value in _flatten(
+                entity.get(identifier), ""
+            )
+        )
+
+
+def _export_entity(
+    entity: type[BaseEntity], export_format: ExportFormat, output: Path
+) -> Path:
+    path = output / f"{entity.yaml_name}.{export_format}"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        if export_format == "jsonl":
+            export_jsonl(entity, f)
+        else:
+            export_csv(entity, f)
+    return path
+
+
+def export(
+    entities: Iterable[type[BaseEntity]],
+    export_format: ExportFormat,
+    output: Path,
+    jobs: int = 1,
+) -> list[Path]:
+    entities = list(entities)
+    output.mkdir(parents=True, exist_ok=True)
+
+    if jobs <= 1 or len(entities) <= 1:
+        return [_export_entity(entity, export_format, output) for entity in entities]
+
+    with cache.process_pool(jobs) as executor:
+        futures = [
+            executor.submit(_export_entity, entity, export_format, output)
+            for entity in entities
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,58 @@
+from collections.abc import Iterable, Sequence
+from functools import partial
+
+from pokedex import cache
+from pokedex.cache.text import normalize_value
+from pokedex.entities.base import BaseEntity, EntityRef
+from pokedex.enums import Language
+
+type Resolved = tuple[tuple[Language, EntityRef[BaseEntity]], ...]
+
+# Unique names handed to each worker at a time
+CHUNK_SIZE = 1000
+
+
+def _resolve(
+    names: Sequence[str], entities: Sequence[type[BaseEntity]]
+) -> list[Resolved]:
+    indexes = [(entity, cache.get(entity).index) for entity in entities]
+    refs: dict[tuple[type[BaseEntity], str], EntityRef[BaseEntity]] = {}
+    normalized = [normalize_value(x) for x in names]
+    results: dict[str, Resolved] = {}
+    for name in dict.fromkeys(normalized):
+        matches = []
+        for entity, index in indexes:
+            for language, identifier in sorted(
+                index.get(name, ()), key=lambda x: (x[1], x[0].value)
+            ):
+                if (ref := refs.get((entity, identifier))) is None:
+                    ref = refs[entity, identifier] = EntityRef(entity, identifier)
+                matches.append((language, ref))
+        results[name] = tuple(matches)
+    return [results[x] for x in normalized]
+
+
+def resolve_names(
+    names: Iterable[str],
+    entities: Iterable[type[BaseEntity]] | None = None,
+    jobs: int = 1,
+) -> list[Resolved]:
+    names = list(names)
+    if entities is None:
+        entities = BaseEntity.__subclasses__()
+    entities = list(entities)
+
+    # Every distinct name is normalized once, and every distinct normalized
+    # name is looked up once in each index
+    unique = list(dict.fromkeys(names))
+
+    if jobs <= 1 or not entities or len(unique) <= CHUNK_SIZE:
+        resolved = _resolve(unique, entities)
+    else:
+        chunks = [unique[i : i + CHUNK_SIZE] for i in range(0, len(unique), CHUNK_SIZE)]
+        with cache.process_pool(jobs) as executor:
+            resolve_chunk = partial(_resolve, entities=entities)
+            resolved = [x for y in executor.map(resolve_chunk, chunks) for x in y]
+
+    results = dict(zip(unique, resolved, strict=True))
+    return [results[name] for name in names]
@@ -0,0 +1,224 @@
+import asyncio
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import suppress
+from functools import partial
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from pokedex import cache
+from pokedex.cache.converter import converter
+from pokedex.context import context_game_group, context_language, set_context
+from pokedex.entities.base import BaseEntity, EntityRef
+from pokedex.enums import GameGroup, Language
+from pokedex.snapshot import collapse
+
+# Responses only depend on the request target: the data can't change while
+# the server is running, and a new version of the package invalidates ETags
+RESPONSE_CACHE_SIZE = 4096
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _search_results(
+    results: list[tuple[Language, EntityRef[BaseEntity]]],
+) -> list[dict[str, str]]:
+    return [
+        {"language": language.value, "identifier": ref.identifier}
+        for language, ref in results
+    ]
+
+
+def _get_entry(
+    entity: type[BaseEntity], identifier: str, query: Mapping[str, str]
+) -> object:
+    try:
+        entry = entity.get(identifier)
+    except KeyError:
+        msg = f"Unknown {entity.__name__} '{identifier}'"
+        raise HTTPError(HTTPStatus.NOT_FOUND, msg) from None
+
+    if "game_group" not in query and "language" not in query:
+        return converter.unstructure(entry)
+
+    # Only the values for the requested game group and language are returned,
+    # picked the same way `Multi.get()` and `Localized.get()` do
+    try:
+        game_group = GameGroup(query.get("game_group", context_game_group.get()))
+        language = Language(query.get("language", context_language.get()))
+    except ValueError as e:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from None
+    with set_context(game_group, language):
+        return converter.unstructure(collapse(entry))
+
+
+def _list_entries(entity: type[BaseEntity], query: Mapping[str, str]) -> object:
+    if "name" in query:
+        try:
+            return _search_results(list(entity.search(query["name"])))
+        except KeyError:
+            return []
+
+    if "text" in query:
+        try:
+            language = Language(query["language"]) if "language" in query else None
+            limit = int(query["limit"]) if "limit" in query else None
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, str(e)) from None
+        return _search_results(list(entity.search_text(query["text"], language, limit)))
+
+    return entity.list_identifiers()
+
+
+def _route(path: list[str], query: Mapping[str, str]) -> object:
+    entities = {entity.yaml_name: entity for entity in BaseEntity.__subclasses__()}
+    if not path:
+        return list(entities)
+
+    if (entity := entities.get(path[0])) is None:
+        msg = f"Unknown entity '{path[0]}'"
+        raise HTTPError(HTTPStatus.NOT_FOUND, msg)
+    if len(path) == 1:
+        return _list_entries(entity, query)
+    if len(path) == 2:
+        return _get_entry(entity, path[1], query)
+
+    msg = "Not found"
+    raise HTTPError(HTTPStatus.NOT_FOUND, msg)
+
+
+def render(target: str) -> tuple[HTTPStatus, bytes]:
+    url = urlsplit(target)
+    path = [unquote(x) for x in url.path.split("/") if x]
+    query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+    try:
+        status, body = HTTPStatus.OK, _route(path, query)
+    except HTTPError as e:
+        status, body = e.status, {"error": str(e)}
+    return status, json.dumps(body, ensure_ascii=False).encode()
+
+
+class _ResponseCache:
+    # Least recently used responses are dropped first. Only touched from the
+    # event loop, while misses are rendered by the cache executor: they read
+    # shelves, and the first one may even build the cache
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._responses = OrderedDict[str, tuple[HTTPStatus, bytes]]()
+
+    async def get(self, target: str) -> tuple[HTTPStatus, bytes]:
+        with suppress(KeyError):
+            self._responses.move_to_end(target)
+            return self._responses[target]
+
+        response = await cache.run_in_executor(
+            ("render", target), partial(render, target)
+        )
+        self._responses[target] = response
+        if len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+        return response
+
+
+def _response(
+    status: HTTPStatus,
+    body: bytes,
+    etag: str,
+    *,
+    keep_alive: bool,
+    extra_headers: Mapping[str, str] | None = None,
+) -> bytes:
+    headers = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    # Only successful responses can be revalidated
+    if status in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED):
+        headers.append(f"ETag: {etag}")
+    headers.extend(f"{name}: {value}" for name, value in (extra_headers or {}).items())
+    if status is not HTTPStatus.NOT_MODIFIED:
+        headers.append(f"Content-Length: {len(body)}")
+    if body:
+        headers.append("Content-Type: application/json; charset=utf-8")
+    if not keep_alive:
+        headers.append("Connection: close")
+    return "\r\n".join([*headers, "", ""]).encode("latin-1") + body
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    *,
+    etag: str,
+    responses: _ResponseCache,
+) -> None:
+    try:
+        while request_line := await reader.readline():
+            headers = {}
+            while (line := await reader.readline()).strip():
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                status, body = HTTPStatus.BAD_REQUEST, b""
+                writer.write(_response(status, body, etag, keep_alive=False))
+                break
+
+            connection = headers.get("connection", "").lower()
+            if version == "HTTP/1.0":
+                keep_alive = connection == "keep-alive"
+            else:
+                keep_alive = connection != "close"
+
+            extra_headers = {}
+            if method != "GET":
+                # The body, if any, is never read: the connection can't be reused
+                status, body = HTTPStatus.METHOD_NOT_ALLOWED, b""
+                keep_alive = False
+                extra_headers["Allow"] = "GET"
+            else:
+                status, body = await responses.get(target)
+                if_none_match = headers.get("if-none-match", "")
+                if status is HTTPStatus.OK and (
+                    if_none_match == "*" or etag in if_none_match.split(", ")
+                ):
+                    status, body = HTTPStatus.NOT_MODIFIED, b""
+
+            writer.write(
+                _response(
+                    status,
+                    body,
+                    etag,
+                    keep_alive=keep_alive,
+                    extra_headers=extra_headers,
+                )
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host: str, port: int) -> asyncio.Server:
+    etag = f'"{cache.package_version()}"'
+    responses = _ResponseCache(RESPONSE_CACHE_SIZE)
+    return await asyncio.start_server(
+        partial(_handle_connection, etag=etag, responses=responses), host, port
+    )
+
+
+def serve(host: str, port: int) -> None:
+    async def main() -> None:
+        server = await start_server(host, port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
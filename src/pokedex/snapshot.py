@@ -0,0 +1,229 @@
+import pickle
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Self, cast, overload
+
+from pokedex import cache
+from pokedex.context import context_game_group, context_language, set_context
+from pokedex.entities.abilities import Ability
+from pokedex.entities.base import (
+    BaseEntity,
+    EntityRef,
+    Localized,
+    Multi,
+    SimpleLocalized,
+    SubEntity,
+)
+from pokedex.entities.egg_groups import EggGroup
+from pokedex.entities.items import Item
+from pokedex.entities.moves import Move
+from pokedex.entities.natures import Nature
+from pokedex.entities.pokemon import Pokemon, PokemonForm, PokemonGmaxForm
+from pokedex.entities.types import Type
+from pokedex.enums import Game, GameGroup, HeldItemSlot, Language, Stat
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+
+# Entries collapsed for a single game group and language: localized and
+# per game group values are resolved, entity references become identifiers
+@dataclass(frozen=True, slots=True)
+class AbilityRecord:
+    identifier: str
+    names: str | None
+    descriptions: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class EggGroupRecord:
+    identifier: str
+    names: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ItemRecord:
+    identifier: str
+    names: str | None
+    descriptions: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class MoveRecord:
+    identifier: str
+    names: str | None
+    descriptions: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class NatureRecord:
+    identifier: str
+    names: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonFormRecord:
+    identifier: str
+    form_id: int | None
+    names: str | None
+
+    base_stats: Mapping[Stat, int] | None
+    evs_yield: Mapping[Stat, int] | None
+
+    types: tuple[str, ...] | None
+    egg_groups: tuple[str, ...] | None
+    abilities: tuple[str, ...] | None
+    hidden_ability: str | None
+
+    held_items: Mapping[HeldItemSlot, str | Mapping[Game, str]] | None
+
+    descriptions: Mapping[Game, str] | None
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonGmaxFormRecord:
+    identifier: str
+    form_id: int | None
+    names: str | None
+    descriptions: Mapping[Game, str] | None
+
+
+@dataclass(frozen=True, slots=True)
+class PokemonRecord:
+    identifier: str
+    species_id: int | None
+    names: str | None
+    forms: Mapping[str, PokemonFormRecord]
+    gmax_forms: Mapping[str, PokemonGmaxFormRecord]
+
+
+@dataclass(frozen=True, slots=True)
+class TypeRecord:
+    identifier: str
+    names: str | None
+
+
+type Record = (
+    AbilityRecord
+    | EggGroupRecord
+    | ItemRecord
+    | MoveRecord
+    | NatureRecord
+    | PokemonRecord
+    | TypeRecord
+)
+
+RECORD_TYPES: Mapping[type[BaseEntity | SubEntity], type["DataclassInstance"]] = {
+    Ability: AbilityRecord,
+    EggGroup: EggGroupRecord,
+    Item: ItemRecord,
+    Move: MoveRecord,
+    Nature: NatureRecord,
+    Pokemon: PokemonRecord,
+    PokemonForm: PokemonFormRecord,
+    PokemonGmaxForm: PokemonGmaxFormRecord,
+    Type: TypeRecord,
+}
+
+
+def collapse(value: object) -> object:
+    # Resolves a value for the current game group and language, entities and
+    # sub-entities become records
+    if isinstance(value, Multi | SimpleLocalized | Localized):
+        value = value.get()
+
+    if isinstance(value, EntityRef):
+        return value.identifier
+    if isinstance(value, BaseEntity | SubEntity):
+        return RECORD_TYPES[type(value)](
+            **{
+                field.name: collapse(getattr(value, field.name))
+                for field in fields(value)
+            }
+        )
+    if isinstance(value, Mapping):
+        return {k: collapse(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return tuple(collapse(x) for x in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    game_group: GameGroup
+    language: Language
+    version: str
+    records: Mapping[type[BaseEntity], Mapping[str, Record]]
+
+    @classmethod
+    def build(
+        cls,
+        game_group: GameGroup | None = None,
+        language: Language | None = None,
+        entities: Iterable[type[BaseEntity]] | None = None,
+    ) -> Self:
+        if game_group is None:
+            game_group = context_game_group.get()
+        if language is None:
+            language = context_language.get()
+        if entities is None:
+            entities = BaseEntity.__subclasses__()
+
+        records: dict[type[BaseEntity], dict[str, Record]] = {}
+        with set_context(game_group, language):
+            for entity in entities:
+                records[entity] = {
+                    identifier: cast("Record", collapse(entity.get(identifier)))
+                    for identifier in entity.list_identifiers()
+                }
+
+        version = cache.package_version()
+        return cls(game_group, language, version, records)
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        with path.open("rb") as f:
+            snapshot = pickle.load(f)
+
+        if not isinstance(snapshot, cls):
+            msg = f"'{path}' does not contain a snapshot"
+            raise TypeError(msg)
+
+        version = cache.package_version()
+        if snapshot.version != version:
+            msg = f"Snapshot version '{snapshot.version}' does not match '{version}'"
+            raise ValueError(msg)
+
+        return snapshot
+
+    def dump(self, path: Path) -> None:
+        with path.open("wb") as f:
+            pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
+
+    @overload
+    def get(self, entity: type[Ability], identifier: str) -> AbilityRecord: ...
+
+    @overload
+    def get(self, entity: type[EggGroup], identifier: str) -> EggGroupRecord: ...
+
+    @overload
+    def get(self, entity: type[Item], identifier: str) -> ItemRecord: ...
+
+    @overload
+    def get(self, entity: type[Move], identifier: str) -> MoveRecord: ...
+
+    @overload
+    def get(self, entity: type[Nature], identifier: str) -> NatureRecord: ...
+
+    @overload
+    def get(self, entity: type[Pokemon], identifier: str) -> PokemonRecord: ...
+
+    @overload
+    def get(self, entity: type[Type], identifier: str) -> TypeRecord: ...
+
+    def get(self, entity: type[BaseEntity], identifier: str) -> Record:
+        return self.records[entity][identifier]
+
+    def list_identifiers(self, entity: type[BaseEntity]) -> list[str]:
+        return list(self.records[entity])
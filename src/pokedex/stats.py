@@ -0,0 +1,181 @@
+import math
+from array import array
+from collections.abc import Mapping, Sequence, Sized
+
+from pokedex.entities.natures import Nature
+from pokedex.entities.pokemon import PokemonForm
+from pokedex.enums import GameGroup, Stat
+
+_STATS = (
+    Stat.HP,
+    Stat.ATTACK,
+    Stat.DEFENSE,
+    Stat.SPECIAL_ATTACK,
+    Stat.SPECIAL_DEFENSE,
+    Stat.SPEED,
+)
+_GEN_1_STATS = (Stat.HP, Stat.ATTACK, Stat.DEFENSE, Stat.SPEED, Stat.SPECIAL)
+
+_GEN_1_GAME_GROUPS = frozenset({GameGroup.RED_BLUE, GameGroup.YELLOW})
+_GEN_2_GAME_GROUPS = frozenset({GameGroup.GOLD_SILVER, GameGroup.CRYSTAL})
+
+# Their stats aren't derived from effort values, with formulas of their own
+_UNSUPPORTED_GAME_GROUPS = frozenset(
+    {GameGroup.LETS_GO_PIKACHU_EEVEE, GameGroup.LEGENDS_ARCEUS, GameGroup.LEGENDS_ZA}
+)
+
+
+def _dv_stats(
+    stats: Sequence[Stat],
+    base_stats: Sequence[Mapping[Stat, int]],
+    levels: Sequence[int],
+    ivs: Mapping[Stat, Sequence[int]],
+    evs: Mapping[Stat, Sequence[int]],
+) -> dict[Stat, list[int]]:
+    # Before Gen 3 the HP DV is made of the lowest bit of the other ones, and
+    # Gen 2 still uses the DV and stat experience of the special stat for both
+    # special attack and special defense
+    hp_dvs = [
+        (attack & 1) << 3 | (defense & 1) << 2 | (speed & 1) << 1 | (special & 1)
+        for attack, defense, speed, special in zip(
+            ivs[Stat.ATTACK],
+            ivs[Stat.DEFENSE],
+            ivs[Stat.SPEED],
+            ivs[Stat.SPECIAL],
+            strict=True,
+        )
+    ]
+
+    result: dict[Stat, list[int]] = {}
+    for stat in stats:
+        source = stat
+        if stat in (Stat.SPECIAL_ATTACK, Stat.SPECIAL_DEFENSE):
+            source = Stat.SPECIAL
+        dvs = hp_dvs if stat is Stat.HP else ivs[source]
+        # The square root of the stat experience, rounded up and capped at 255
+        bonuses = [
+            min(255, math.isqrt(x - 1) + 1 if x else 0) // 4 for x in evs[source]
+        ]
+        points = [
+            ((base[stat] + dv) * 2 + bonus) * level // 100
+            for base, dv, bonus, level in zip(
+                base_stats, dvs, bonuses, levels, strict=True
+            )
+        ]
+        if stat is Stat.HP:
+            result[stat] = [
+                x + level + 10 for x, level in zip(points, levels, strict=True)
+            ]
+        else:
+            result[stat] = [x + 5 for x in points]
+    return result
+
+
+def _iv_stats(
+    base_stats: Sequence[Mapping[Stat, int]],
+    levels: Sequence[int],
+    ivs: Mapping[Stat, Sequence[int]],
+    evs: Mapping[Stat, Sequence[int]],
+    natures: Sequence[Nature] | None,
+) -> dict[Stat, list[int]]:
+    modified_stats: list[tuple[Stat | None, Stat | None]]
+    if natures is None:
+        modified_stats = [(None, None)] * len(levels)
+    else:
+        distinct = {x.identifier: x for x in natures}
+        by_identifier = {
+            identifier: (nature.increased_stat, nature.decreased_stat)
+            for identifier, nature in distinct.items()
+        }
+        modified_stats = [by_identifier[x.identifier] for x in natures]
+
+    result: dict[Stat, list[int]] = {}
+    for stat in _STATS:
+        bases = [x[stat] for x in base_stats]
+        points = [
+            (2 * base + iv + ev // 4) * level // 100
+            for base, iv, ev, level in zip(
+                bases, ivs[stat], evs[stat], levels, strict=True
+            )
+        ]
+        if stat is Stat.HP:
+            # Shedinja always has a single HP
+            result[stat] = [
+                1 if base == 1 else x + level + 10
+                for base, x, level in zip(bases, points, levels, strict=True)
+            ]
+        else:
+            result[stat] = [
+                (x + 5)
+                * (110 if increased is stat else 90 if decreased is stat else 100)
+                // 100
+                for x, (increased, decreased) in zip(
+                    points, modified_stats, strict=True
+                )
+            ]
+    return result
+
+
+def _check_columns(
+    game_group: GameGroup,
+    forms: Sequence[PokemonForm],
+    levels: Sequence[int],
+    ivs: Mapping[Stat, Sequence[int]],
+    evs: Mapping[Stat, Sequence[int]],
+    natures: Sequence[Nature] | None,
+) -> None:
+    required_ivs: Sequence[Stat]
+    required_evs: Sequence[Stat]
+    if game_group in _GEN_1_GAME_GROUPS | _GEN_2_GAME_GROUPS:
+        required_evs = _GEN_1_STATS
+        # The HP DV is derived from the other ones
+        required_ivs = [x for x in _GEN_1_STATS if x is not Stat.HP]
+    else:
+        required_ivs = required_evs = _STATS
+
+    columns: dict[str, Sized] = {"levels": levels}
+    for name, values, required in (
+        ("ivs", ivs, required_ivs),
+        ("evs", evs, required_evs),
+    ):
+        for stat in required:
+            if stat not in values:
+                msg = f"Missing {name} for {stat.value}"
+                raise ValueError(msg)
+            columns[f"{name} for {stat.value}"] = values[stat]
+    if natures is not None:
+        columns["natures"] = natures
+
+    for name, column in columns.items():
+        if len(column) != len(forms):
+            msg = f"Got {len(column)} {name}, expected {len(forms)} (one per form)"
+            raise ValueError(msg)
+
+
+def calculate_stats(
+    game_group: GameGroup,
+    forms: Sequence[PokemonForm],
+    levels: Sequence[int],
+    ivs: Mapping[Stat, Sequence[int]],
+    evs: Mapping[Stat, Sequence[int]],
+    natures: Sequence[Nature] | None = None,
+) -> dict[Stat, array[int]]:
+    # Every argument holds one column of a batch, with one row per Pokemon.
+    # Before Gen 3 `ivs` are DVs (without HP, derived from the other ones),
+    # `evs` are stat experience and `natures` are ignored. Without `natures`
+    # all of them are neutral
+    if game_group in _UNSUPPORTED_GAME_GROUPS:
+        msg = f"Stats can't be calculated for {game_group.value}"
+        raise ValueError(msg)
+
+    _check_columns(game_group, forms, levels, ivs, evs, natures)
+
+    base_stats = [form.base_stats[game_group] for form in forms]
+    if game_group in _GEN_1_GAME_GROUPS:
+        stats = _dv_stats(_GEN_1_STATS, base_stats, levels, ivs, evs)
+    elif game_group in _GEN_2_GAME_GROUPS:
+        stats = _dv_stats(_STATS, base_stats, levels, ivs, evs)
+    else:
+        stats = _iv_stats(base_stats, levels, ivs, evs, natures)
+
+    return {stat: array("I", values) for stat, values in stats.items()}
@@ -0,0 +1,26 @@
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pokedex import cache
+
+
+@pytest.fixture(scope="session")
+def default_cache_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    if env_path := os.getenv("POKEDEX_DEFAULT_CACHE_PATH"):
+        return Path(env_path)
+    return tmp_path_factory.mktemp("cache")
+
+
+@pytest.fixture(scope="module")
+def isolated_cache(default_cache_path: Path) -> Iterator[Path]:
+    # For modules loading a cache of their own: the previous one, if any, is
+    # put back afterwards, otherwise the default one is loaded again on demand
+    previous = dict(cache.data)
+    yield default_cache_path
+    for cache_data in cache.data.values():
+        cache_data.close()
+    cache.data.clear()
+    cache.data.update(previous)
@@ -0,0 +1,41 @@
+import asyncio
+
+from pokedex import Language, Move, Pokemon, aload_all, cache, set_context
+from pokedex.context import context_language
+
+
+def test_aget() -> None:
+    async def main() -> None:
+        await aload_all()
+        pikachu, eevee = await asyncio.gather(
+            Pokemon.aget("pikachu"), Pokemon.aget("eevee")
+        )
+        assert pikachu == Pokemon.get("pikachu")
+        assert eevee == Pokemon.get("eevee")
+
+    asyncio.run(main())
+
+
+def test_asearch() -> None:
+    async def main() -> None:
+        assert await Move.asearch("Mach Punch") == Move.search("Mach Punch")
+        assert await Move.alist_identifiers() == Move.list_identifiers()
+
+    asyncio.run(main())
+
+
+def test_coalescing() -> None:
+    async def main() -> None:
+        results = await asyncio.gather(*(Pokemon.aget("mew") for _ in range(10)))
+        assert all(x is results[0] for x in results)
+
+    asyncio.run(main())
+
+
+def test_context() -> None:
+    async def main() -> None:
+        with set_context(Language.GERMAN):
+            language = await cache.run_in_executor(object(), context_language.get)
+        assert language is Language.GERMAN
+
+    asyncio.run(main())
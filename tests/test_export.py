@@ -0,0 +1,38 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+
+from pokedex import EggGroup, Nature, Type
+from pokedex.export import CSV_HEADER, export
+
+
+def test_export_jsonl(tmp_path: Path) -> None:
+    (path,) = export([Type], "jsonl", tmp_path)
+    assert path == tmp_path / "types.jsonl"
+
+    with path.open(encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+
+    assert [x["identifier"] for x in entries] == list(Type.list_identifiers())
+    normal = next(x for x in entries if x["identifier"] == "normal")
+    assert normal["names"]["red_blue"]["en"] == "NORMAL"
+    assert normal["names"]["scarlet_violet"]["fr"] == "Normal"
+
+
+def test_export_csv(tmp_path: Path) -> None:
+    (path,) = export([EggGroup], "csv", tmp_path)
+
+    with path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+
+    assert tuple(rows[0]) == CSV_HEADER
+    assert ["field", "names", "", "de", "Feld"] in rows[1:]
+
+
+@pytest.mark.filterwarnings("ignore:.*use of fork\\(\\) may lead to deadlocks")
+def test_export_parallel(tmp_path: Path) -> None:
+    paths = export([Nature, Type], "csv", tmp_path, jobs=2)
+    assert paths == [tmp_path / "natures.csv", tmp_path / "types.csv"]
+    assert all(path.stat().st_size for path in paths)
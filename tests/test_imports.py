@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+import pytest
+
+CODE = """
+import sys
+before = set(sys.modules)
+import pokedex
+print("\\n".join(set(sys.modules) - before))
+"""
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "asyncio",
+        "cattrs",
+        "concurrent.futures",
+        "importlib.metadata",
+        "pokedex.cache.converter",
+        "pokedex.snapshot",
+        "sqlite3",
+        "yaml",
+    ],
+)
+def test_lazy_imports(module: str) -> None:
+    result = subprocess.run(
+        [sys.executable, "-c", CODE], capture_output=True, text=True, check=True
+    )
+    imported = result.stdout.split()
+    assert "pokedex" in imported
+    assert module not in imported
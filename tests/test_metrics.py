@@ -0,0 +1,118 @@
+import dataclasses
+import os
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from pokedex import Move, Nature, Pokemon, cache
+from pokedex.cache import metrics
+
+
+@pytest.fixture(autouse=True)
+def enable_metrics() -> Iterator[None]:
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_stats() -> None:
+    assert Pokemon.get("pikachu") == Pokemon.get("pikachu")
+    Move.search("Splash")
+    with pytest.raises(KeyError):
+        Move.search("Not a move")
+
+    stats = cache.stats()
+    assert stats["pokemon"]["read"].count == 2
+    assert stats["pokemon"]["decode"].count == 2
+    assert sum(stats["pokemon"]["decode"].buckets) == 2
+    assert stats["pokemon"]["decode"].total > 0
+    assert stats["moves"]["search_hit"].count == 1
+    assert stats["moves"]["search_miss"].count == 1
+
+
+def test_hooks() -> None:
+    events: list[tuple[str, str, float | None]] = []
+
+    def hook(name: str, entity: str, duration: float | None) -> None:
+        events.append((name, entity, duration))
+
+    metrics.add_hook(hook)
+    try:
+        Move.get("splash")
+        Move.search("Splash")
+    finally:
+        metrics.remove_hook(hook)
+
+    assert [(name, entity) for name, entity, _ in events] == [
+        ("read", "moves"),
+        ("decode", "moves"),
+        ("search_hit", "moves"),
+    ]
+    assert events[2][2] is None
+
+
+def test_disabled() -> None:
+    metrics.disable()
+    Pokemon.get("pikachu")
+    assert cache.stats() == {}
+
+
+def test_failing_hook() -> None:
+    def hook(name: str, entity: str, duration: float | None) -> None:
+        msg = f"Can't export {name} for {entity} ({duration})"
+        raise ValueError(msg)
+
+    metrics.add_hook(hook)
+    try:
+        with pytest.warns(RuntimeWarning, match="Can't export"):
+            assert Pokemon.get("pikachu").identifier == "pikachu"
+    finally:
+        metrics.remove_hook(hook)
+    assert cache.stats()["pokemon"]["read"].count == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore:.*use of fork\\(\\) may lead to deadlocks")
+def test_fork(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics.record("read", "pokemon")
+
+    # Forked while another thread is in the middle of copying the metrics
+    copying, forked = threading.Event(), threading.Event()
+
+    def replace(metric: metrics.Metric, *, buckets: list[int]) -> metrics.Metric:
+        copying.set()
+        forked.wait()
+        return dataclasses.replace(metric, buckets=buckets)
+
+    monkeypatch.setattr(metrics, "replace", replace)
+    thread = threading.Thread(target=cache.stats)
+    thread.start()
+    copying.wait()
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        status = 0
+        try:
+            monkeypatch.undo()
+            metrics.record("read", "pokemon")
+            assert cache.stats()["pokemon"]["read"].count == 2
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    forked.set()
+    thread.join()
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
+def test_text_index_loaded_once() -> None:
+    # Natures have no description, hence no text index in any language
+    Nature.search_text("x")
+    metrics.reset()
+    Nature.search_text("x")
+    assert list(cache.stats()["natures"]) == ["search_text"]
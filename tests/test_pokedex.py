@@ -1,4 +1,9 @@
+import os
+import pickle
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import pytest
 
@@ -18,6 +23,9 @@ from pokedex import (
 )
 from pokedex.entities.base import BaseEntity, EntityRef
 
+# Open file descriptors of the process
+FDS = Path("/proc/self/fd")
+
 
 @pytest.mark.parametrize(
     ("entity", "identifier"),
@@ -162,3 +170,141 @@ def test_context() -> None:
         assert articuno_names.get() == "Articuno"
         assert articuno.species_id.get() == 144
         assert articuno_names.get(Language.CHINESE_SIMPLIFIED) == "急冻鸟"
+
+
+@pytest.mark.parametrize("entity", BaseEntity.__subclasses__())
+def test_concurrent_reads(entity: type[BaseEntity]) -> None:
+    identifiers = list(entity.list_identifiers())[:50]
+    expected = [entity.get(x) for x in identifiers]
+
+    def read(i: int) -> list[BaseEntity]:
+        return [entity.get(x) for x in identifiers[i:] + identifiers[:i]]
+
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(read, range(16)))
+
+    for i, result in enumerate(results):
+        assert result == expected[i:] + expected[:i]
+
+
+@pytest.mark.skipif(not FDS.is_dir(), reason="requires procfs")
+@pytest.mark.filterwarnings("error")
+def test_concurrent_reloads() -> None:
+    cache_data = cache.get(Pokemon)
+    barrier = threading.Barrier(8)
+
+    def read(_: int) -> None:
+        # Every thread of the pool reads once, closing its stale handles
+        Pokemon.get("pikachu")
+        Move.get("tackle")
+        barrier.wait()
+
+    # SQLite may hold on to a closed file descriptor while the file has other
+    # connections, the count is only stable once the pool has reloaded once
+    fds = []
+    with ThreadPoolExecutor(8) as executor:
+        for _ in range(5):
+            cache.load_all(cache_data.path.parent, cache_data.backend)
+            list(executor.map(read, range(8)))
+            fds.append(len(list(FDS.iterdir())))
+    assert len(set(fds[1:])) == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore:.*use of fork\\(\\) may lead to deadlocks")
+def test_fork() -> None:
+    pikachu = Pokemon.get("pikachu")
+    cache_data = cache.get(Pokemon)
+    parent_shelf = cache_data.shelf
+    assert cache_data.index
+
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        status = 0
+        try:
+            assert cache_data.shelf is not parent_shelf
+            assert Pokemon.get("pikachu") == pikachu
+            assert Pokemon.search("Pikachu")
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert cache_data.shelf is parent_shelf
+    assert Pokemon.get("eevee").identifier == "eevee"
+
+
+def test_get_by_species_id() -> None:
+    pikachu = Pokemon.get("pikachu")
+    assert Pokemon.get_by_species_id(25) == pikachu
+    assert Pokemon.get_by_species_id(25, GameGroup.RED_BLUE) == pikachu
+    with set_context(GameGroup.SWORD_SHIELD):
+        assert Pokemon.get_by_species_id(25) == pikachu
+
+    with pytest.raises(KeyError):
+        Pokemon.get_by_species_id(0)
+    with pytest.raises(KeyError):
+        Pokemon.get_by_species_id(-1)
+    with pytest.raises(KeyError):
+        Pokemon.get_by_species_id(152, GameGroup.RED_BLUE)
+
+    pokemon, form = Pokemon.get_by_form_id(25, 1, GameGroup.SWORD_SHIELD)
+    assert pokemon == pikachu
+    assert form == pikachu.forms["pikachu_original_cap"]
+
+    pokemon, form = Pokemon.get_by_form_id(25, 1, GameGroup.OMEGA_RUBY_ALPHA_SAPPHIRE)
+    assert form == pikachu.forms["pikachu_rock_star"]
+
+    with pytest.raises(KeyError):
+        Pokemon.get_by_form_id(25, 1, GameGroup.RED_BLUE)
+
+
+@pytest.mark.parametrize(
+    ("entity", "query", "language", "identifier"),
+    [
+        (Move, "sharply raises the user's Attack", Language.ENGLISH, "swords_dance"),
+        (Move, "endormir", Language.FRENCH, "sing"),
+        (Item, "Un pépite d'or pur", None, "nugget"),
+        (Ability, "電気", Language.JAPANESE_KANJI, "static"),
+        (Pokemon, "electric cheek sacs", Language.ENGLISH, "pikachu"),
+    ],
+)
+def test_search_text(
+    entity: type[BaseEntity], query: str, language: Language | None, identifier: str
+) -> None:
+    results = entity.search_text(query, language, limit=10)
+    assert len(results) <= 10
+    assert identifier in {ref.identifier for _, ref in results}
+    if language is not None:
+        assert all(x is language for x, _ in results)
+
+
+def test_projections() -> None:
+    pikachu = Pokemon.get("pikachu")
+    names = pikachu.names
+
+    french = names.with_language(Language.FRENCH)
+    assert french[GameGroup.RED_BLUE] == "PIKACHU"
+    assert names.with_language(Language.FRENCH) is french
+    with set_context(Language.FRENCH):
+        assert names.with_language() is french
+
+    red_blue = names.with_game_group(GameGroup.RED_BLUE)
+    assert red_blue[Language.ENGLISH] == "PIKACHU"
+    assert names.with_game_group(GameGroup.RED_BLUE) is red_blue
+
+    groups = pikachu.species_id.group()
+    assert groups == [(set(pikachu.species_id), 25)]
+    groups[0][0].clear()
+    assert pikachu.species_id.group() == [(set(pikachu.species_id), 25)]
+    assert pikachu.species_id.single() == 25
+
+    with pytest.raises(ValueError, match="Not all values are the same"):
+        names.single()
+
+    unpickled = pickle.loads(pickle.dumps(names))
+    assert unpickled == names
+    assert unpickled.with_language(Language.FRENCH) == french
+    assert pickle.dumps(unpickled) == pickle.dumps(names)
@@ -0,0 +1,55 @@
+import gc
+import pickle
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pokedex import GameGroup, Pokemon, Type, cache
+from pokedex.entities.base import EntityRef
+
+
+@pytest.fixture(scope="module", autouse=True)
+def preloaded(isolated_cache: Path) -> Iterator[None]:
+    cache.load_all(isolated_cache, preload=True)
+    yield
+    cache.load_all(isolated_cache)
+
+
+def test_preload() -> None:
+    assert gc.get_freeze_count() > 0
+    assert Pokemon.get("pikachu") is Pokemon.get("pikachu")
+    assert "pikachu" in Pokemon.list_identifiers()
+    with pytest.raises(KeyError):
+        Pokemon.get("_index")
+    with pytest.raises(TypeError):
+        cache.get(Pokemon).entries["pikachu"] = Pokemon.get("bulbasaur")  # type: ignore[index]
+
+
+def test_entity_refs() -> None:
+    (electric,) = Pokemon.get("pikachu").forms["pikachu"].types[GameGroup.RED_BLUE]
+    assert electric.target is Type.get("electric")
+    assert electric.get() is electric.target
+
+    unpickled = pickle.loads(pickle.dumps(electric))
+    assert unpickled == electric
+    assert unpickled.target is None
+
+
+def test_memory_report() -> None:
+    report = cache.memory_report()
+    assert set(report) == {x.yaml_name for x in cache.data}
+    assert report["pokemon"] > report["types"] > 0
+    assert EntityRef(Type, "electric").target is None
+
+
+def test_reload(isolated_cache: Path) -> None:
+    # Replacing preloaded data makes the previous graph collectable again
+    pikachu, frozen = Pokemon.get("pikachu"), gc.get_freeze_count()
+    cache.load_all(isolated_cache, preload=True)
+    assert Pokemon.get("pikachu") is not pikachu
+    assert gc.get_freeze_count() < frozen * 1.5
+
+    cache.load_all(isolated_cache)
+    assert gc.get_freeze_count() == 0
+    cache.load_all(isolated_cache, preload=True)
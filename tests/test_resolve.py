@@ -0,0 +1,40 @@
+from contextlib import suppress
+
+import pytest
+
+from pokedex import Item, Language, Move, Pokemon, Type, resolve_names
+from pokedex.entities.base import BaseEntity, EntityRef
+from pokedex.resolve import CHUNK_SIZE
+
+
+def test_resolve_names() -> None:
+    names = ["Pikachu", "nothing", "THUNDERBOLT", "pikachu", "Électrik"]
+    results = resolve_names(names, [Pokemon, Move, Type])
+
+    assert len(results) == len(names)
+    assert (Language.ENGLISH, EntityRef(Pokemon, "pikachu")) in results[0]
+    assert results[1] == ()
+    assert (Language.ENGLISH, EntityRef(Move, "thunderbolt")) in results[2]
+    assert results[3] == results[0]
+    assert results[4] == ((Language.FRENCH, EntityRef(Type, "electric")),)
+
+
+def test_resolve_names_search() -> None:
+    entities: list[type[BaseEntity]] = [Pokemon, Move, Item]
+    for name in ["Pikachu", "Mach Punch", "Master Ball"]:
+        expected: list[tuple[Language, EntityRef[BaseEntity]]] = []
+        for entity in entities:
+            with suppress(KeyError):
+                expected.extend(entity.search(name))
+        (result,) = resolve_names([name], entities)
+        assert sorted(result, key=repr) == sorted(expected, key=repr)
+
+
+@pytest.mark.filterwarnings("ignore:.*use of fork\\(\\) may lead to deadlocks")
+def test_resolve_names_parallel() -> None:
+    identifiers = list(Type.list_identifiers()) * CHUNK_SIZE
+    names = [f"{x} {i}" for i, x in enumerate(identifiers)]
+    names += ["Pikachu", "Electric"]
+    results = resolve_names(names, [Pokemon, Type], jobs=2)
+    assert results == resolve_names(names, [Pokemon, Type])
+    assert (Language.ENGLISH, EntityRef(Type, "electric")) in results[-1]
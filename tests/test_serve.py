@@ -0,0 +1,138 @@
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+
+import pytest
+
+from pokedex import serve
+from pokedex.serve import render, start_server
+
+
+@pytest.mark.parametrize(
+    ("target", "status", "expected"),
+    [
+        ("/types", HTTPStatus.OK, ["electric"]),
+        ("/types/electric?language=fr", HTTPStatus.OK, {"names": "Électrik"}),
+        (
+            "/types/electric?game_group=red_blue&language=fr",
+            HTTPStatus.OK,
+            {"names": "ELECTRIK"},
+        ),
+        (
+            "/moves?name=Mach%20Punch",
+            HTTPStatus.OK,
+            [{"language": "en", "identifier": "mach_punch"}],
+        ),
+        (
+            "/moves?text=sleep&language=en&limit=1",
+            HTTPStatus.OK,
+            [{"language": "en", "identifier": "spore"}],
+        ),
+        ("/moves?name=nothing", HTTPStatus.OK, []),
+        ("/types/nothing", HTTPStatus.NOT_FOUND, {"error": "Unknown Type 'nothing'"}),
+        ("/nothing", HTTPStatus.NOT_FOUND, {"error": "Unknown entity 'nothing'"}),
+        ("/types/electric/nothing", HTTPStatus.NOT_FOUND, {"error": "Not found"}),
+    ],
+)
+def test_render(target: str, status: HTTPStatus, expected: object) -> None:
+    response_status, body = render(target)
+    assert response_status == status
+
+    response = json.loads(body)
+    if isinstance(expected, dict):
+        assert expected.items() <= response.items()
+    else:
+        assert isinstance(expected, list)
+        assert all(x in response for x in expected)
+        assert expected or not response
+
+
+def test_render_bad_request() -> None:
+    status, body = render("/types/electric?language=xx")
+    assert status == HTTPStatus.BAD_REQUEST
+    assert "error" in json.loads(body)
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: str
+) -> tuple[bytes, dict[str, str], bytes]:
+    writer.write(request.encode())
+    status = await reader.readline()
+    headers = {}
+    while line := (await reader.readline()).decode().strip():
+        name, _, value = line.partition(":")
+        headers[name.lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return status, headers, body
+
+
+async def _check_server() -> None:
+    server = await start_server("127.0.0.1", 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        status, headers, body = await _request(
+            reader, writer, "GET /types/electric HTTP/1.1\r\n\r\n"
+        )
+        assert status.startswith(b"HTTP/1.1 200")
+        assert json.loads(body)["identifier"] == "electric"
+
+        # Same connection, the client already has the current version
+        status, _, body = await _request(
+            reader,
+            writer,
+            f"GET /types/electric HTTP/1.1\r\nIf-None-Match: {headers['etag']}\r\n\r\n",
+        )
+        assert status.startswith(b"HTTP/1.1 304")
+        assert not body
+
+        # Only successful responses are validated
+        status, _, body = await _request(
+            reader,
+            writer,
+            f"GET /types/unknown HTTP/1.1\r\nIf-None-Match: {headers['etag']}\r\n\r\n",
+        )
+        assert status.startswith(b"HTTP/1.1 404")
+        assert json.loads(body) == {"error": "Unknown Type 'unknown'"}
+
+        status, headers, _ = await _request(
+            reader, writer, "POST /types HTTP/1.1\r\n\r\n"
+        )
+        assert status.startswith(b"HTTP/1.1 405")
+        assert headers["allow"] == "GET"
+        assert headers["connection"] == "close"
+        assert not await reader.read()
+        writer.close()
+
+
+def test_server() -> None:
+    asyncio.run(_check_server())
+
+
+async def _get_twice(target: str) -> None:
+    server = await start_server("127.0.0.1", 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for _ in range(2):
+            status, _, _ = await _request(
+                reader, writer, f"GET {target} HTTP/1.1\r\n\r\n"
+            )
+            assert status.startswith(b"HTTP/1.1 200")
+        writer.close()
+
+
+def test_render_off_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads = []
+
+    def recording_render(target: str) -> tuple[HTTPStatus, bytes]:
+        threads.append(threading.get_ident())
+        return render(target)
+
+    # Rendered once, and not by the thread running the event loop
+    monkeypatch.setattr(serve, "render", recording_render)
+    asyncio.run(_get_twice("/types/electric"))
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
@@ -0,0 +1,41 @@
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from pokedex import GameGroup, Language, Pokemon, Snapshot, Stat, Type
+from pokedex.snapshot import RECORD_TYPES
+
+
+@pytest.fixture(scope="module")
+def snapshot() -> Snapshot:
+    return Snapshot.build(GameGroup.RED_BLUE, Language.FRENCH, [Pokemon, Type])
+
+
+def test_snapshot(snapshot: Snapshot) -> None:
+    pikachu = snapshot.get(Pokemon, "pikachu")
+    assert not hasattr(pikachu, "__dict__")
+    assert pikachu.identifier == "pikachu"
+    assert pikachu.species_id == 25
+    assert pikachu.names == "PIKACHU"
+
+    form = pikachu.forms["pikachu"]
+    assert form.base_stats is not None
+    assert form.types == ("electric",)
+    assert form.base_stats[Stat.SPECIAL] == 50
+
+    electric = snapshot.get(Type, "electric")
+    assert electric.names == "ELECTRIK"
+
+    assert snapshot.list_identifiers(Type) == list(Type.list_identifiers())
+
+
+def test_dump_load(snapshot: Snapshot, tmp_path: Path) -> None:
+    path = tmp_path / "snapshot.pickle"
+    snapshot.dump(path)
+    assert Snapshot.load(path) == snapshot
+
+
+def test_record_types() -> None:
+    for entity, record_type in RECORD_TYPES.items():
+        assert [x.name for x in fields(record_type)] == [x.name for x in fields(entity)]
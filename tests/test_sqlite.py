@@ -0,0 +1,70 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pokedex import GameGroup, Item, Language, Move, Pokemon, cache
+from pokedex.cache import sqlite
+from pokedex.entities.base import EntityRef
+
+
+@pytest.fixture(scope="module", autouse=True)
+def sqlite_backend(isolated_cache: Path) -> None:
+    cache.load_all(isolated_cache, "sqlite")
+
+
+def test_get() -> None:
+    assert cache.get(Pokemon).backend == "sqlite"
+    assert Pokemon.get("pikachu").species_id.get(GameGroup.RED_BLUE) == 25
+    assert Pokemon.get_by_species_id(25).identifier == "pikachu"
+    assert (Language.ENGLISH, EntityRef(Move, "mach_punch")) in Move.search(
+        "Mach Punch"
+    )
+    assert Move.search_text("sleep", Language.ENGLISH, 1) == [
+        (Language.ENGLISH, EntityRef(Move, "spore"))
+    ]
+    assert "master_ball" in Item.list_identifiers()
+
+
+def test_query() -> None:
+    ((count,),) = sqlite.query(
+        "SELECT COUNT(*) FROM pokemon_forms WHERE game_group = ?",
+        (GameGroup.RED_BLUE.value,),
+    )
+    assert count == 151
+
+    names = sqlite.names_starting_with(Move, "Thunder", Language.ENGLISH)
+    assert (Language.ENGLISH, EntityRef(Move, "thunderbolt")) in names
+
+    items = sqlite.introduced_in(Item, GameGroup.X_Y)
+    assert EntityRef(Item, "abomasite") in items
+    assert EntityRef(Item, "master_ball") not in items
+
+
+def test_match_names() -> None:
+    try:
+        names = sqlite.match_names(Move, "punch")
+    except sqlite3.OperationalError:
+        pytest.skip("SQLite built without FTS5")
+    assert (Language.ENGLISH, EntityRef(Move, "mach_punch")) in names
+
+
+def test_read_only() -> None:
+    with pytest.raises(TypeError):
+        cache.get(Pokemon).shelf["pikachu"] = Pokemon.get("bulbasaur")
+
+
+def test_connections() -> None:
+    database = cache.get(Pokemon).database
+    assert database is not None
+    assert cache.get(Move).database is database
+
+    # Shared by the shelves and the queries of a thread, one per thread
+    Pokemon.get("pikachu")
+    connection = database.connection
+    assert sqlite.query("SELECT 1") == [(1,)]
+    assert database.connection is connection
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(lambda: database.connection).result() is not connection
+        assert executor.submit(sqlite.query, "SELECT 1").result() == [(1,)]
@@ -0,0 +1,114 @@
+import pytest
+
+from pokedex import GameGroup, Nature, Pokemon, Stat, calculate_stats
+
+
+def test_nature() -> None:
+    adamant = Nature.get("adamant")
+    assert adamant.increased_stat is Stat.ATTACK
+    assert adamant.decreased_stat is Stat.SPECIAL_ATTACK
+
+    hardy = Nature.get("hardy")
+    assert hardy.increased_stat is None
+    assert hardy.decreased_stat is None
+
+
+def test_calculate_stats() -> None:
+    garchomp = Pokemon.get("garchomp").forms["garchomp"]
+    shedinja = Pokemon.get("shedinja").forms["shedinja"]
+    stats = calculate_stats(
+        GameGroup.SWORD_SHIELD,
+        [garchomp, shedinja, garchomp],
+        [78, 50, 100],
+        {
+            Stat.HP: [24, 31, 31],
+            Stat.ATTACK: [12, 31, 31],
+            Stat.DEFENSE: [30, 31, 31],
+            Stat.SPECIAL_ATTACK: [16, 31, 31],
+            Stat.SPECIAL_DEFENSE: [23, 31, 31],
+            Stat.SPEED: [5, 31, 31],
+        },
+        {
+            Stat.HP: [74, 252, 0],
+            Stat.ATTACK: [190, 0, 0],
+            Stat.DEFENSE: [91, 0, 0],
+            Stat.SPECIAL_ATTACK: [48, 0, 0],
+            Stat.SPECIAL_DEFENSE: [84, 0, 0],
+            Stat.SPEED: [23, 0, 0],
+        },
+        [Nature.get("adamant"), Nature.get("jolly"), Nature.get("hardy")],
+    )
+
+    assert {stat: list(values) for stat, values in stats.items()} == {
+        Stat.HP: [289, 1, 357],
+        Stat.ATTACK: [278, 110, 296],
+        Stat.DEFENSE: [193, 65, 226],
+        Stat.SPECIAL_ATTACK: [135, 45, 196],
+        Stat.SPECIAL_DEFENSE: [171, 50, 206],
+        Stat.SPEED: [171, 66, 240],
+    }
+
+
+@pytest.mark.parametrize(
+    ("game_group", "expected"),
+    [
+        (
+            GameGroup.RED_BLUE,
+            {
+                Stat.HP: 189,
+                Stat.ATTACK: 137,
+                Stat.DEFENSE: 101,
+                Stat.SPEED: 190,
+                Stat.SPECIAL: 128,
+            },
+        ),
+        (
+            GameGroup.GOLD_SILVER,
+            {
+                Stat.HP: 189,
+                Stat.ATTACK: 137,
+                Stat.DEFENSE: 101,
+                Stat.SPECIAL_ATTACK: 128,
+                Stat.SPECIAL_DEFENSE: 112,
+                Stat.SPEED: 190,
+            },
+        ),
+    ],
+)
+def test_calculate_stats_dvs(game_group: GameGroup, expected: dict[Stat, int]) -> None:
+    pikachu = Pokemon.get("pikachu").forms["pikachu"]
+    stats = calculate_stats(
+        game_group,
+        [pikachu],
+        [81],
+        {Stat.ATTACK: [8], Stat.DEFENSE: [13], Stat.SPEED: [5], Stat.SPECIAL: [9]},
+        {
+            Stat.HP: [22850],
+            Stat.ATTACK: [23140],
+            Stat.DEFENSE: [17280],
+            Stat.SPEED: [24795],
+            Stat.SPECIAL: [19625],
+        },
+    )
+    assert {stat: values[0] for stat, values in stats.items()} == expected
+
+
+def test_calculate_stats_errors() -> None:
+    pikachu = Pokemon.get("pikachu").forms["pikachu"]
+    ivs = {x: [31] for x in Stat}
+    evs = {x: [0] for x in Stat}
+    natures = [Nature.get("hardy")] * 2
+    dvs: dict[Stat, list[int]] = {x: [15] for x in Stat if x is not Stat.SPECIAL}
+
+    with pytest.raises(ValueError, match="legends_arceus"):
+        calculate_stats(GameGroup.LEGENDS_ARCEUS, [pikachu], [50], ivs, evs)
+    with pytest.raises(ValueError, match=r"Got 2 levels, expected 1 \(one per form\)"):
+        calculate_stats(GameGroup.SCARLET_VIOLET, [pikachu], [50, 50], ivs, evs)
+    with pytest.raises(ValueError, match=r"Got 0 evs for speed, expected 1"):
+        calculate_stats(
+            GameGroup.SCARLET_VIOLET, [pikachu], [50], ivs, {**evs, Stat.SPEED: []}
+        )
+    with pytest.raises(ValueError, match="Got 2 natures, expected 1"):
+        calculate_stats(GameGroup.SCARLET_VIOLET, [pikachu], [50], ivs, evs, natures)
+    with pytest.raises(ValueError, match="Missing ivs for special"):
+        calculate_stats(GameGroup.GOLD_SILVER, [pikachu], [50], dvs, evs)
@@ -0,0 +1,120 @@
+import dbm
+import os
+import shelve
+import shutil
+import warnings
+from pathlib import Path
+
+import pytest
+
+from pokedex import EggGroup, cache
+from pokedex.cache import CorruptedCacheWarning, manifest
+from pokedex.cache.manifest import Verify
+
+
+@pytest.fixture
+def cache_path(isolated_cache: Path, tmp_path: Path) -> Path:
+    # A copy of the default cache, so that it can be damaged
+    cache.load_all(isolated_cache, "shelve")
+    for entity in cache.data:
+        for path in isolated_cache.glob(f"{entity.yaml_name}*"):
+            if "-" not in path.name:
+                shutil.copy(path, tmp_path)
+    return tmp_path
+
+
+def _mtimes(path: Path) -> dict[str, int]:
+    # SQLite's shared memory and write-ahead log files are touched by readers
+    return {x.name: x.stat().st_mtime_ns for x in path.iterdir() if "-" not in x.name}
+
+
+@pytest.mark.parametrize("verify", ["fast", "full"])
+def test_verify(cache_path: Path, verify: Verify) -> None:
+    mtimes = _mtimes(cache_path)
+    cache.load_all(cache_path, "shelve", verify=verify)
+    assert _mtimes(cache_path) == mtimes
+
+
+def test_truncated(cache_path: Path) -> None:
+    shelf_path = cache_path / EggGroup.yaml_name
+    with shelf_path.open("r+b") as f:
+        f.truncate(shelf_path.stat().st_size // 2)
+    mtimes = _mtimes(cache_path)
+
+    with pytest.warns(CorruptedCacheWarning, match="egg_groups") as record:
+        cache.load_all(cache_path, "shelve")
+    assert record[0].filename == __file__
+
+    # Only the damaged shelf is rebuilt
+    rebuilt = {x for x, y in _mtimes(cache_path).items() if mtimes.get(x) != y}
+    assert rebuilt == {"egg_groups", "egg_groups.manifest.json"}
+    assert EggGroup.get("field").identifier == "field"
+
+
+def test_corrupted(cache_path: Path) -> None:
+    with dbm.open(cache_path / EggGroup.yaml_name, "w") as db:
+        db[b"field"] = bytes(len(db[b"field"]))
+
+    # Same size and number of records: only a full verification notices
+    cache.load_all(cache_path, "shelve")
+    with pytest.warns(CorruptedCacheWarning, match="egg_groups"):
+        cache.load_all(cache_path, "shelve", verify="full")
+    cache.load_all(cache_path, "shelve", verify="full")
+
+
+@pytest.mark.parametrize("verify", ["fast", "full"])
+def test_damaged_header(cache_path: Path, verify: Verify) -> None:
+    # Same size, but dbm can't even tell which kind of database it is anymore
+    shelf_path = cache_path / EggGroup.yaml_name
+    with shelf_path.open("r+b") as f:
+        f.write(bytes(16))
+
+    with pytest.warns(CorruptedCacheWarning, match="egg_groups.*can't be read"):
+        cache.load_all(cache_path, "shelve", verify=verify)
+    assert EggGroup.get("field").identifier == "field"
+
+
+def test_missing_manifest(cache_path: Path) -> None:
+    manifest_path = cache_path / "egg_groups.manifest.json"
+    manifest_path.unlink()
+    umask = os.umask(0o022)
+    try:
+        with pytest.warns(CorruptedCacheWarning, match="manifest is missing"):
+            cache.load_all(cache_path, "shelve")
+    finally:
+        os.umask(umask)
+    assert manifest_path.stat().st_mode & 0o777 == 0o644
+
+
+def test_pre_manifest(cache_path: Path) -> None:
+    # Shelves built before manifests existed had no format either
+    with shelve.open(cache_path / EggGroup.yaml_name, "w") as db:
+        del db["_format"]
+    (cache_path / "egg_groups.manifest.json").unlink()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cache.load_all(cache_path, "shelve")
+    assert (cache_path / "egg_groups.manifest.json").is_file()
+
+
+def test_lazy_load(cache_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (cache_path / "egg_groups.manifest.json").unlink()
+    monkeypatch.setenv("POKEDEX_DEFAULT_CACHE_PATH", str(cache_path))
+    monkeypatch.setenv("POKEDEX_DEFAULT_CACHE_BACKEND", "shelve")
+    cache.data.clear()
+
+    with pytest.warns(CorruptedCacheWarning, match="manifest is missing") as record:
+        EggGroup.get("field")
+    assert record[0].filename == __file__
+
+
+def test_create_temp(tmp_path: Path) -> None:
+    umask = os.umask(0o027)
+    try:
+        fd, temp_path = manifest.create_temp(tmp_path / "egg_groups")
+    finally:
+        os.umask(umask)
+    os.close(fd)
+    assert temp_path.parent == tmp_path
+    assert temp_path.stat().st_mode & 0o777 == 0o640